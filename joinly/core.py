@@ -139,14 +139,15 @@ class TTS(Protocol):
 
     audio_format: AudioFormat
 
-    def stream(self, text: str) -> AsyncIterator[bytes]:
+    def stream(self, text: str) -> AsyncIterator[bytes | memoryview]:
         """Convert text to synthesized speech.
 
         Args:
             text: The text to synthesize.
 
         Returns:
-            AsyncIterator[bytes]: Stream of raw PCM audio data in the specified format.
+            AsyncIterator[bytes | memoryview]: Stream of raw PCM audio data in the
+                specified format.
         """
         ...
 
@@ -15,6 +15,18 @@ from joinly.utils.logging import configure_logging
 logger = logging.getLogger(__name__)
 
 
+def _install_uvloop() -> None:
+    """Use uvloop as the event loop implementation if it is installed."""
+    try:
+        # optional dependency, so it is only imported when requested
+        import uvloop  # type: ignore[import-not-found]  # noqa: PLC0415
+    except ImportError:
+        logger.debug("uvloop not installed, using the default asyncio event loop")
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.debug("Using uvloop event loop")
+
+
 def _parse_kv(
     _ctx: click.Context, _param: click.Parameter, value: tuple[str]
 ) -> dict[str, object]:
@@ -345,6 +357,7 @@ def cli(  # noqa: PLR0913
         quiet=quiet,
         plain=logging_plain,
     )
+    _install_uvloop()
 
     if server is True or (server is None and meeting_url is None):
         mcp.run(transport="streamable-http", host=host, port=port, show_banner=False)
@@ -1,10 +1,13 @@
 import asyncio
 import contextlib
 import logging
-from collections import defaultdict
+import socket
+from collections import deque
 from collections.abc import AsyncIterator
+from functools import cache, lru_cache
 from typing import Self
 
+import numpy as np
 from deepgram import (
     AsyncListenWebSocketClient,
     DeepgramClient,
@@ -21,12 +24,220 @@ from joinly.types import (
     SpeechWindow,
     TranscriptSegment,
 )
-from joinly.utils.audio import calculate_audio_duration
 from joinly.utils.logging import LOGGING_TRACE
 from joinly.utils.usage import add_usage
 
 logger = logging.getLogger(__name__)
 
+_USAGE_REPORT_INTERVAL = 1.0
+_MERGE_TOLERANCE = 1e-3
+_NS_TO_S = 1e-9
+_RESULT_BATCH_SIZE = 16
+
+
+@cache
+def _silence(n_bytes: int) -> bytes:
+    """Get zero-filled silence of the given size, shared across instances."""
+    return bytes(n_bytes)
+
+
+def _speaker_overlaps(  # noqa: PLR0913
+    starts: np.ndarray,
+    ends: np.ndarray,
+    ids: np.ndarray,
+    *,
+    n_speakers: int,
+    start: float,
+    end: float,
+    scratch: np.ndarray | None = None,
+) -> np.ndarray:
+    """Sum up the overlap of windows with an interval per speaker.
+
+    Args:
+        starts: The start times of the windows in seconds.
+        ends: The end times of the windows in seconds.
+        ids: The speaker ids of the windows.
+        n_speakers: The number of distinct speaker ids.
+        start: The start time of the interval in seconds.
+        end: The end time of the interval in seconds.
+        scratch: Optional preallocated (2, n) float32 buffer to compute in.
+
+    Returns:
+        np.ndarray: The total overlap in seconds indexed by speaker id.
+    """
+    n = len(starts)
+    if scratch is None:
+        scratch = np.empty((2, n), dtype=np.float32)
+    overlap = scratch[0, :n]
+    latest_start = scratch[1, :n]
+    np.minimum(ends, end, out=overlap)
+    np.maximum(starts, start, out=latest_start)
+    np.subtract(overlap, latest_start, out=overlap)
+    np.maximum(overlap, 0.0, out=overlap)
+    return np.bincount(ids, weights=overlap, minlength=n_speakers)
+
+
+@cache
+def _deepgram_client() -> DeepgramClient:
+    """Get the Deepgram client shared by all STT instances."""
+    config = DeepgramClientOptions(options={"keep_alive": True})
+    return DeepgramClient(config=config)
+
+
+@lru_cache(maxsize=32)
+def _live_options(
+    model: str, sample_rate: int, language: str, keyterm: tuple[str, ...] | None
+) -> LiveOptions:
+    """Build the live transcription options, cached per configuration."""
+    return LiveOptions(
+        model=model,
+        encoding="linear16",
+        sample_rate=sample_rate,
+        language=language,
+        channels=1,
+        endpointing=False,
+        interim_results=False,
+        punctuate=True,
+        profanity_filter=True,
+        vad_events=False,
+        keyterm=list(keyterm) if keyterm is not None else None,
+    )
+
+
+class _SpeakerWindows:
+    """Time-ordered speaker windows stored in contiguous arrays.
+
+    Adjacent windows of the same speaker are merged into a single interval, which
+    does not change the per-speaker overlap with any interval. Windows have to be
+    appended in time order and queried with intervals that do
+    not start before a previously queried interval. Windows that end before a
+    queried interval can not match any later query and are discarded.
+    """
+
+    def __init__(self, capacity: int = 256, thread_threshold: int = 2000) -> None:
+        """Initialize the speaker windows.
+
+        Args:
+            capacity: The initial number of windows to allocate (default is 256).
+            thread_threshold: The number of windows overlapping a queried interval
+                above which attribution runs in a worker thread instead of
+                blocking the event loop (default is 2000).
+        """
+        self._starts = np.empty(capacity, dtype=np.float32)
+        self._ends = np.empty(capacity, dtype=np.float32)
+        self._ids = np.empty(capacity, dtype=np.int32)
+        self._scratch = np.empty((2, capacity), dtype=np.float32)
+        self._thread_threshold = thread_threshold
+        self._cursor: int = 0
+        self._size: int = 0
+        self._speaker_ids: dict[str, int] = {}
+        self._speakers: list[str] = []
+
+    def __len__(self) -> int:
+        """Get the number of stored windows."""
+        return self._size - self._cursor
+
+    def append(self, start: float, end: float, speaker: str) -> None:
+        """Append a speaker window.
+
+        Args:
+            start: The start time of the window in seconds.
+            end: The end time of the window in seconds.
+            speaker: The speaker of the window.
+        """
+        speaker_id = self._speaker_ids.get(speaker)
+        if speaker_id is None:
+            speaker_id = self._speaker_ids[speaker] = len(self._speakers)
+            self._speakers.append(speaker)
+
+        # extend the last window if it continues the same speaker
+        if (
+            self._size > self._cursor
+            and self._ids[self._size - 1] == speaker_id
+            and abs(self._ends[self._size - 1] - start) < _MERGE_TOLERANCE
+        ):
+            self._ends[self._size - 1] = end
+            return
+
+        if self._size == len(self._starts):
+            self._reserve()
+        self._starts[self._size] = start
+        self._ends[self._size] = end
+        self._ids[self._size] = speaker_id
+        self._size += 1
+
+    async def dominant_speaker(
+        self, start: float, end: float
+    ) -> tuple[str | None, float]:
+        """Get the speaker with the largest overlap with the given interval.
+
+        Args:
+            start: The start time of the interval in seconds.
+            end: The end time of the interval in seconds.
+
+        Returns:
+            tuple[str | None, float]: The speaker and its overlap in seconds, or
+                (None, 0.0) if no windows overlap the interval.
+        """
+        # skip windows ending before the interval, they never match again
+        self._cursor += int(
+            np.searchsorted(self._ends[self._cursor : self._size], start)
+        )
+        lo = self._cursor
+        hi = lo + int(np.searchsorted(self._starts[lo : self._size], end))
+        n = hi - lo
+        if n <= 0:
+            return None, 0.0
+        if len(self._speakers) == 1:
+            # only one speaker observed, so its overlap needs no per-speaker sums
+            overlap = np.minimum(self._ends[lo:hi], end) - np.maximum(
+                self._starts[lo:hi], start
+            )
+            return self._speakers[0], float(np.maximum(overlap, 0.0).sum())
+
+        if n > self._thread_threshold:
+            # copy, since windows may be appended or compacted meanwhile
+            totals = await asyncio.to_thread(
+                _speaker_overlaps,
+                self._starts[lo:hi].copy(),
+                self._ends[lo:hi].copy(),
+                self._ids[lo:hi].copy(),
+                n_speakers=len(self._speakers),
+                start=start,
+                end=end,
+            )
+        else:
+            # reuse preallocated scratch rows instead of allocating per segment
+            totals = _speaker_overlaps(
+                self._starts[lo:hi],
+                self._ends[lo:hi],
+                self._ids[lo:hi],
+                n_speakers=len(self._speakers),
+                start=start,
+                end=end,
+                scratch=self._scratch,
+            )
+        idx = int(totals.argmax())
+        return self._speakers[idx], float(totals[idx])
+
+    def _reserve(self) -> None:
+        """Make room for new windows by discarding skipped ones or growing."""
+        capacity = len(self._starts)
+        if self._cursor >= capacity // 2:
+            n = self._size - self._cursor
+            self._starts[:n] = self._starts[self._cursor : self._size]
+            self._ends[:n] = self._ends[self._cursor : self._size]
+            self._ids[:n] = self._ids[self._cursor : self._size]
+            self._cursor = 0
+            self._size = n
+            return
+
+        capacity *= 2
+        self._starts = np.resize(self._starts, capacity)
+        self._ends = np.resize(self._ends, capacity)
+        self._ids = np.resize(self._ids, capacity)
+        self._scratch = np.empty((2, capacity), dtype=np.float32)
+
 
 class DeepgramSTT(STT):
     """A class to transcribe audio using Deepgram."""
@@ -40,7 +251,9 @@ class DeepgramSTT(STT):
         finalize_silence: float = 0.375,
         finalize_min_speech: float = 0.03,
         padding_silence: float = 0.1,
+        batch_duration: float = 0.1,
         stream_idle_timeout: float = 1.0,
+        attribution_thread_threshold: int = 2000,
         mip_opt_out: bool = True,
     ) -> None:
         """Initialize the DeepgramSTT.
@@ -56,14 +269,19 @@ class DeepgramSTT(STT):
                 0.03 seconds).
             padding_silence: The duration of silence to pad at the start of each audio
                 window (default is 0.1 seconds).
+            batch_duration: The maximum duration of audio to coalesce into a single
+                WebSocket message, also used as the maximum time to hold back audio
+                before sending (default is 0.1 seconds).
             stream_idle_timeout: The duration to wait after finalizing the stream before
                 closing it (default is 1.0 seconds). Normally, this should never
                 trigger as the stream is finalized.
+            attribution_thread_threshold: The number of speaker windows overlapping
+                a segment above which speaker attribution is offloaded to a worker
+                thread to keep the event loop responsive (default is 2000).
             mip_opt_out: Whether to opt out of the model improvement program
                 (default is True). See more at https://developers.deepgram.com/docs/the-deepgram-model-improvement-partnership-program.
         """
-        config = DeepgramClientOptions(options={"keep_alive": True})
-        dg = DeepgramClient(config=config)
+        dg = _deepgram_client()
         self._client: AsyncListenWebSocketClient = dg.listen.asyncwebsocket.v("1")  # type: ignore[attr-type]
         self.model_name = model_name or (
             "nova-3-general"
@@ -72,31 +290,34 @@ class DeepgramSTT(STT):
         )
         self.finalize_silence = float(finalize_silence)
         self.finalize_min_speech = float(finalize_min_speech)
-        self._live_options = LiveOptions(
-            model=self.model_name,
-            encoding="linear16",
-            sample_rate=sample_rate,
-            language=get_settings().language,
-            channels=1,
-            endpointing=False,
-            interim_results=False,
-            punctuate=True,
-            profanity_filter=True,
-            vad_events=False,
-            keyterm=(
-                (hotwords or []) + [get_settings().name]
+        self._live_options = _live_options(
+            self.model_name,
+            sample_rate,
+            get_settings().language,
+            (
+                (*(hotwords or []), get_settings().name)
                 if self.model_name.startswith("nova-3")
                 else None
             ),
         )
         self._mip_opt_out = bool(mip_opt_out)
         self._stream_idle_timeout = stream_idle_timeout
+        self._attribution_thread_threshold = int(attribution_thread_threshold)
         self._sent_seconds = 0.0
-        self._queue: asyncio.Queue[TranscriptSegment | None] | None = None
+        self._results: deque[tuple[str, float, float] | None] | None = None
+        self._results_ready = asyncio.Event()
         self._lock = asyncio.Lock()
         self.audio_format = AudioFormat(sample_rate=sample_rate, byte_depth=2)
+        self._bytes_per_second = (
+            self.audio_format.sample_rate * self.audio_format.byte_depth
+        )
+        self._batch_duration = float(batch_duration)
+        self._batch_bytes = (
+            int(self._batch_duration * self.audio_format.sample_rate)
+            * self.audio_format.byte_depth
+        )
         self._padding_silence_dur = float(padding_silence)
-        self._padding_silence = b"\x00" * (
+        self._padding_silence = _silence(
             int(self._padding_silence_dur * self.audio_format.sample_rate)
             * self.audio_format.byte_depth
         )
@@ -108,7 +329,8 @@ class DeepgramSTT(STT):
             raise RuntimeError(msg)
 
         self._sent_seconds = 0.0
-        self._queue = asyncio.Queue[TranscriptSegment | None]()
+        self._results = deque[tuple[str, float, float] | None]()
+        self._results_ready.clear()
 
         async def on_result(
             _client: AsyncListenWebSocketClient,
@@ -120,14 +342,11 @@ class DeepgramSTT(STT):
             if result.channel.alternatives:
                 transcript = result.channel.alternatives[0].transcript
                 if transcript:
-                    segment = TranscriptSegment(
-                        text=transcript,
-                        start=result.start - self._sent_seconds,
-                        end=result.start - self._sent_seconds + result.duration,
-                    )
-                    await self._queue.put(segment)  # type: ignore[attr-defined]
+                    # plain tuple, the segment is only built once when yielded
+                    start = result.start - self._sent_seconds
+                    self._push_result((transcript, start, start + result.duration))
             if result.from_finalize:
-                await self._queue.put(None)  # type: ignore[attr-defined]
+                self._push_result(None)
 
         self._client.on(LiveTranscriptionEvents.Transcript, on_result)  # type: ignore[arg-type]
 
@@ -142,6 +361,7 @@ class DeepgramSTT(STT):
             msg = "Failed to connect to Deepgram STT service."
             logger.error(msg)
             raise RuntimeError(msg)
+        self._set_tcp_nodelay()
         logger.debug("Connected to Deepgram STT service")
 
         return self
@@ -150,7 +370,50 @@ class DeepgramSTT(STT):
         """Exit the context."""
         logger.debug("Closing Deepgram STT service connection")
         await self._client.finish()
-        self._queue = None
+        self._results = None
+
+    def _set_tcp_nodelay(self) -> None:
+        """Disable Nagle's algorithm on the underlying WebSocket connection.
+
+        The audio is sent in small, frequent messages which Nagle's algorithm would
+        hold back while waiting for acknowledgements. Asyncio transports usually set
+        this already, but the socket is only reachable through SDK internals, so
+        this is best effort.
+        """
+        ws = getattr(self._client, "_socket", None)
+        transport = getattr(ws, "transport", None)
+        sock = transport.get_extra_info("socket") if transport is not None else None
+        if sock is None:
+            logger.debug("Could not access Deepgram STT socket to set TCP_NODELAY")
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            logger.debug("Failed to set TCP_NODELAY on Deepgram STT socket")
+
+    def _report_usage(self, duration: float) -> None:
+        """Report the usage for sent audio.
+
+        Args:
+            duration: The duration of the sent audio in seconds.
+        """
+        add_usage(
+            service="deepgram_stt",
+            usage={"minutes": duration / 60},
+            meta={"model": self.model_name, "mip_opt_out": self._mip_opt_out},
+        )
+
+    def _push_result(self, result: tuple[str, float, float] | None) -> None:
+        """Hand a result over to the consuming stream.
+
+        Args:
+            result: The transcribed text with its start and end time relative to
+                the stream, or None to mark a finalization.
+        """
+        if self._results is None:
+            return
+        self._results.append(result)
+        self._results_ready.set()
 
     async def stream(  # noqa: C901, PLR0915
         self, windows: AsyncIterator[SpeechWindow]
@@ -163,81 +426,146 @@ class DeepgramSTT(STT):
         Yields:
             TranscriptSegment: The transcribed segments.
         """
-        if self._queue is None or not await self._client.is_connected():
+        results = self._results
+        if results is None or not await self._client.is_connected():
             msg = "STT service is not started."
             raise RuntimeError(msg)
 
-        stream_start: float | None = None
-        stream_end: float | None = None
-        speaker_windows: list[tuple[float, float, str]] = []
+        stream_start_ns: int | None = None
+        stream_end_ns: int | None = None
+        speaker_windows = _SpeakerWindows(
+            thread_threshold=self._attribution_thread_threshold
+        )
         finalize_pending: int = 0
+        unreported_ns: int = 0
 
-        async def _producer() -> None:
+        async def _producer() -> None:  # noqa: C901, PLR0915
             """Producer coroutine to send audio data."""
-            nonlocal stream_start, stream_end, finalize_pending
+            nonlocal stream_start_ns, stream_end_ns, finalize_pending, unreported_ns
+            loop = asyncio.get_running_loop()
+            # hot attributes are bound to locals once for the per-window loop
+            now = loop.time
+            send = self._client.send
+            sw_append = speaker_windows.append
+            bps = self._bytes_per_second
+            batch_bytes = self._batch_bytes
+            batch_duration = self._batch_duration
+            # the padding silence is sent as part of the first batch
+            batch = bytearray(self._padding_silence)
+            last_flush = now()
+            last_usage = last_flush
             if self._padding_silence:
                 self._sent_seconds += self._padding_silence_dur
-                await self._client.send(self._padding_silence)
-                add_usage(
-                    service="deepgram_stt",
-                    usage={"minutes": self._padding_silence_dur / 60},
-                    meta={"model": self.model_name, "mip_opt_out": self._mip_opt_out},
-                )
-
-            silence_dur: float = 0.0
-            speech_dur: float = 0.0
-            async for window in windows:
-                if stream_start is None:
-                    stream_start = window.time_ns / 1e9
-                cur = window.time_ns / 1e9
-                dur = calculate_audio_duration(len(window.data), self.audio_format)
-                stream_end = cur + dur
-                if window.speaker is not None:
-                    speaker_windows.append(
-                        (cur - stream_start, cur - stream_start + dur, window.speaker)
-                    )
-                await self._client.send(window.data)
-                add_usage(
-                    service="deepgram_stt",
-                    usage={"minutes": dur / 60},
-                    meta={"model": self.model_name, "mip_opt_out": self._mip_opt_out},
-                )
+                unreported_ns += int(self._padding_silence_dur * 1e9)
+
+            async def _flush() -> None:
+                """Send the coalesced audio as a single message."""
+                nonlocal last_flush
+                last_flush = now()
+                if batch:
+                    data = bytes(batch)
+                    batch.clear()
+                    await send(data)
+
+            async def _windows() -> AsyncIterator[SpeechWindow | None]:
+                """Yield the incoming windows, or None once the batch is due.
+
+                A pending batch is flushed when the source stalls instead of
+                waiting for the next window to arrive.
+                """
+                it = aiter(windows)
+                pending: asyncio.Future[SpeechWindow] | None = None
+                try:
+                    while True:
+                        if batch:
+                            if pending is None:
+                                pending = asyncio.ensure_future(anext(it))
+                            timeout = batch_duration - (now() - last_flush)
+                            done, _ = await asyncio.wait(
+                                {pending}, timeout=max(timeout, 0.0)
+                            )
+                            if not done:
+                                yield None
+                                continue
+                        try:
+                            window = await (pending or anext(it))
+                        except StopAsyncIteration:
+                            return
+                        pending = None
+                        yield window
+                finally:
+                    if pending is not None:
+                        pending.cancel()
+
+            # timestamps are kept as integer nanoseconds to avoid accumulating
+            # floating point errors, converting to seconds only where needed
+            finalize_silence_ns = int(self.finalize_silence * 1e9)
+            finalize_min_speech_ns = int(self.finalize_min_speech * 1e9)
+            silence_ns: int = 0
+            speech_ns: int = 0
+            async for window in _windows():
+                if window is None:
+                    await _flush()
+                    continue
+                data = window.data
+                time_ns = window.time_ns
+                speaker = window.speaker
+                if stream_start_ns is None:
+                    stream_start_ns = time_ns
+                rel_ns = time_ns - stream_start_ns
+                dur_ns = len(data) * 1_000_000_000 // bps
+                stream_end_ns = time_ns + dur_ns
+                if speaker is not None:
+                    sw_append(rel_ns * _NS_TO_S, (rel_ns + dur_ns) * _NS_TO_S, speaker)
+                batch.extend(data)
+                t = now()
+                if len(batch) >= batch_bytes or t - last_flush >= batch_duration:
+                    await _flush()
+                # usage is aggregated and reported in intervals instead of per window
+                unreported_ns += dur_ns
+                if t - last_usage >= _USAGE_REPORT_INTERVAL:
+                    self._report_usage(unreported_ns * _NS_TO_S)
+                    unreported_ns = 0
+                    last_usage = t
 
                 if window.is_speech:
-                    silence_dur = 0.0
-                    speech_dur += dur
+                    silence_ns = 0
+                    speech_ns += dur_ns
                 else:
-                    silence_dur += dur
+                    silence_ns += dur_ns
                     if (
-                        silence_dur >= self.finalize_silence
-                        and speech_dur >= self.finalize_min_speech
+                        silence_ns >= finalize_silence_ns
+                        and speech_ns >= finalize_min_speech_ns
                     ):
                         logger.debug(
                             "Finalizing stream after %.2fs of silence "
                             "with %.2fs of speech.",
-                            silence_dur,
-                            speech_dur,
+                            silence_ns * _NS_TO_S,
+                            speech_ns * _NS_TO_S,
                         )
                         finalize_pending += 1
+                        await _flush()
                         await self._client.finalize()
-                        silence_dur = 0.0
-                        speech_dur = 0.0
+                        silence_ns = 0
+                        speech_ns = 0
 
-            if speech_dur >= self.finalize_min_speech:
+            await _flush()
+            if speech_ns >= finalize_min_speech_ns:
                 finalize_pending += 1
                 await self._client.finalize()
 
             # increase "finalize" without sending to cause next loop iteration
             finalize_pending += 1
-            await self._queue.put(None)  # type: ignore[attr-defined]
+            self._push_result(None)
 
         async with self._lock:
-            while not self._queue.empty():
-                _ = self._queue.get_nowait()
+            results.clear()
+            self._results_ready.clear()
             producer = asyncio.create_task(_producer())
 
             try:
-                while True:
+                finished = False
+                while not finished:
                     cm = (
                         asyncio.timeout(self._stream_idle_timeout)
                         if producer.done()
@@ -245,7 +573,9 @@ class DeepgramSTT(STT):
                     )
                     try:
                         async with cm:
-                            segment = await self._queue.get()
+                            while not results:
+                                self._results_ready.clear()
+                                await self._results_ready.wait()
                     except TimeoutError:
                         logger.warning(
                             "Stream idle timeout (%.2fs) reached before reaching "
@@ -253,33 +583,40 @@ class DeepgramSTT(STT):
                             self._stream_idle_timeout,
                         )
                         break
-                    if segment is None:
-                        finalize_pending -= 1
-                        if producer.done() and finalize_pending <= 0:
-                            break
-                        continue
-
-                    speakers: defaultdict[str, float] = defaultdict(float)
-                    for start, end, speaker in speaker_windows:
-                        speakers[speaker] += max(
-                            0.0, min(end, segment.end) - max(start, segment.start)
+
+                    # drain bursts of results per wake-up
+                    batch = [
+                        results.popleft()
+                        for _ in range(min(len(results), _RESULT_BATCH_SIZE))
+                    ]
+                    offset = (stream_start_ns or 0) * _NS_TO_S
+                    for result in batch:
+                        if result is None:
+                            finalize_pending -= 1
+                            if producer.done() and finalize_pending <= 0:
+                                finished = True
+                                break
+                            continue
+
+                        text, start, end = result
+                        speaker, speaker_time = await speaker_windows.dominant_speaker(
+                            start, end
+                        )
+                        if speaker_time < 0.1 * (end - start):
+                            speaker = None
+
+                        yield TranscriptSegment(
+                            text=text,
+                            start=start + offset,
+                            end=end + offset,
+                            speaker=speaker,
                         )
-                    speaker, speaker_time = max(
-                        speakers.items(),
-                        key=lambda x: x[1],
-                        default=(None, 0),
-                    )
-                    if speaker_time < 0.1 * (segment.end - segment.start):
-                        speaker = None
-
-                    yield TranscriptSegment(
-                        text=segment.text,
-                        start=segment.start + (stream_start or 0),
-                        end=segment.end + (stream_start or 0),
-                        speaker=speaker,
-                    )
             finally:
                 producer.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
                     await producer
-                self._sent_seconds += (stream_end or 0) - (stream_start or 0)
+                self._sent_seconds += (
+                    (stream_end_ns or 0) - (stream_start_ns or 0)
+                ) * _NS_TO_S
+                if unreported_ns > 0:
+                    self._report_usage(unreported_ns * _NS_TO_S)
@@ -1,12 +1,11 @@
 import asyncio
-import io
 import logging
 import os
-import wave
 from collections import defaultdict
 from collections.abc import AsyncIterator
 from typing import Self
 
+import numpy as np
 from google import genai
 from google.genai import types
 
@@ -16,11 +15,30 @@ from joinly.types import (
     SpeechWindow,
     TranscriptSegment,
 )
-from joinly.utils.audio import calculate_audio_duration
+from joinly.utils.audio import (
+    WAV_HEADER_SIZE,
+    calculate_audio_duration,
+    set_wav_size,
+    wav_header,
+)
 from joinly.utils.usage import add_usage
 
 logger = logging.getLogger(__name__)
 
+_INITIAL_BUFFER_SECONDS = 10.0
+
+
+def _discard(task: asyncio.Task[str]) -> None:
+    """Cancel a speculative transcription whose result is no longer needed.
+
+    Args:
+        task: The transcription task to discard.
+    """
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled() and task.exception() is not None:
+        logger.debug("Discarded prefetched transcription failed: %s", task.exception())
+
 
 class GoogleSTT(STT):
     """Speech-to-Text (STT) service using Gemini audio understanding API."""
@@ -31,6 +49,7 @@ class GoogleSTT(STT):
         model_name: str = "gemini-2.5-flash",
         prompt: str = "Generate a transcript of the speech.",
         sample_rate: int = 16000,
+        prefetch_silence: float | None = None,
     ) -> None:
         """Initialize the Gemini STT service.
 
@@ -38,6 +57,10 @@ class GoogleSTT(STT):
             model_name: The Gemini model to use for audio understanding.
             prompt: The prompt to send with the audio to request a transcript.
             sample_rate: The sample rate of the audio (default is 16000).
+            prefetch_silence: Seconds of trailing silence after which the request
+                is started before the stream ends, at most once per utterance. A
+                request discarded because speech resumed is still billed. None
+                disables prefetching (default is None).
         """
         if os.getenv("GEMINI_API_KEY") is None and os.getenv("GOOGLE_API_KEY") is None:
             msg = "GEMINI_API_KEY or GOOGLE_API_KEY must be set in the environment."
@@ -47,9 +70,13 @@ class GoogleSTT(STT):
         self._prompt = prompt
         self._client: genai.Client | None = None
         self._lock = asyncio.Lock()
+        self._prefetch_silence = prefetch_silence
 
         # Gemini downsamples audio to 16kHz for processing
         self.audio_format = AudioFormat(sample_rate=sample_rate, byte_depth=2)
+        self._wav_header = np.frombuffer(
+            wav_header(0, self.audio_format), dtype=np.uint8
+        )
 
     async def __aenter__(self) -> Self:
         """Initialize the Gemini client."""
@@ -63,14 +90,16 @@ class GoogleSTT(STT):
         """Clean up resources."""
         self._client = None
 
-    async def stream(
+    async def stream(  # noqa: C901, PLR0912, PLR0915
         self, windows: AsyncIterator[SpeechWindow]
     ) -> AsyncIterator[TranscriptSegment]:
         """Transcribe audio stream using Gemini audio understanding.
 
         Note: The Gemini audio understanding API is not a streaming API.
         This method buffers the entire audio stream, then sends it for
-        transcription as a single request.
+        transcription as a single request. Once enough trailing silence was
+        buffered, the request can be started speculatively once per utterance.
+        If speech resumes, the audio is sent again after the stream ended.
 
         Args:
             windows: An asynchronous iterator of audio windows to transcribe.
@@ -85,39 +114,131 @@ class GoogleSTT(STT):
         # Buffer the entire audio stream
         start_time: float | None = None
         end_time: float = 0.0
-        audio_buffer = bytearray()
+        # preallocated buffer with room for the WAV header in front of the audio
+        audio_buffer = np.empty(
+            WAV_HEADER_SIZE
+            + int(
+                _INITIAL_BUFFER_SECONDS
+                * self.audio_format.sample_rate
+                * self.audio_format.byte_depth
+            ),
+            dtype=np.uint8,
+        )
+        n_bytes: int = WAV_HEADER_SIZE
         speakers: defaultdict[str, float] = defaultdict(float)
+        # the primary speaker is tracked while buffering
+        top_speaker: str | None = None
+        top_time: float = 0.0
+        speech_seen: bool = False
+        silence: float = 0.0
+        prefetch: asyncio.Task[str] | None = None
+        prefetched: bool = False
 
-        async for window in windows:
-            if start_time is None:
-                start_time = window.time_ns / 1e9
+        try:
+            async for window in windows:
+                if start_time is None:
+                    start_time = window.time_ns / 1e9
 
-            audio_buffer.extend(window.data)
+                data = np.frombuffer(window.data, dtype=np.uint8)
+                n_new = n_bytes + len(data)
+                if n_new > len(audio_buffer):
+                    grown = np.empty(max(2 * len(audio_buffer), n_new), dtype=np.uint8)
+                    grown[:n_bytes] = audio_buffer[:n_bytes]
+                    audio_buffer = grown
+                audio_buffer[n_bytes:n_new] = data
+                n_bytes = n_new
 
-            duration = calculate_audio_duration(len(window.data), self.audio_format)
-            end_time = (window.time_ns / 1e9) + duration
-            if window.speaker:
-                speakers[window.speaker] += duration
+                duration = calculate_audio_duration(len(window.data), self.audio_format)
+                end_time = (window.time_ns / 1e9) + duration
+                if window.speaker:
+                    speaker_time = speakers[window.speaker] + duration
+                    speakers[window.speaker] = speaker_time
+                    if speaker_time > top_time:
+                        top_speaker, top_time = window.speaker, speaker_time
 
-        if not audio_buffer:
-            logger.warning("Received no audio data to transcribe.")
-            return
+                if window.is_speech:
+                    speech_seen = True
+                    silence = 0.0
+                    if prefetch is not None:
+                        _discard(prefetch)
+                        prefetch = None
+                    continue
 
-        # Convert PCM to WAV format
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(self.audio_format.byte_depth)
-            wf.setframerate(self.audio_format.sample_rate)
-            wf.writeframes(audio_buffer)
-        wav_buffer.seek(0)
-        audio_bytes = wav_buffer.getvalue()
+                silence += duration
+                if (
+                    not prefetched
+                    and speech_seen
+                    and self._prefetch_silence is not None
+                    and silence >= self._prefetch_silence
+                ):
+                    logger.debug(
+                        "Prefetching transcription after %.2fs of silence.", silence
+                    )
+                    prefetched = True
+                    prefetch = asyncio.create_task(
+                        self._transcribe(
+                            self._wav_bytes(audio_buffer, n_bytes),
+                            n_bytes - WAV_HEADER_SIZE,
+                        )
+                    )
 
-        # Send to Gemini API
-        async with self._lock:
-            audio_duration_secs = calculate_audio_duration(
-                len(audio_buffer), self.audio_format
+            pcm_size = n_bytes - WAV_HEADER_SIZE
+            if not pcm_size:
+                logger.warning("Received no audio data to transcribe.")
+                return
+
+            # only silence followed the prefetched audio, so its result is reused
+            if prefetch is not None:
+                transcribed_text = await prefetch
+                prefetch = None
+            else:
+                transcribed_text = await self._transcribe(
+                    self._wav_bytes(audio_buffer, n_bytes), pcm_size
+                )
+        finally:
+            if prefetch is not None:
+                _discard(prefetch)
+
+        if transcribed_text:
+            yield TranscriptSegment(
+                text=transcribed_text,
+                start=start_time or 0.0,
+                end=end_time,
+                speaker=top_speaker,
             )
+        else:
+            logger.info("Gemini returned an empty transcription.")
+
+    def _wav_bytes(self, audio_buffer: np.ndarray, n_bytes: int) -> bytes:
+        """Fill in the reserved WAV header and copy out the WAV file.
+
+        Args:
+            audio_buffer: The buffer holding the header slot followed by the PCM.
+            n_bytes: The number of used bytes in the buffer, including the header.
+
+        Returns:
+            bytes: The audio encoded as a WAV file.
+        """
+        audio_buffer[:WAV_HEADER_SIZE] = self._wav_header
+        set_wav_size(audio_buffer, n_bytes - WAV_HEADER_SIZE)
+        return audio_buffer[:n_bytes].tobytes()
+
+    async def _transcribe(self, audio_bytes: bytes, pcm_size: int) -> str:
+        """Send the WAV encoded audio to Gemini and return the transcript.
+
+        Args:
+            audio_bytes: The audio encoded as a WAV file.
+            pcm_size: The size of the contained PCM audio in bytes.
+
+        Returns:
+            str: The stripped transcribed text, empty if nothing was recognized.
+        """
+        if self._client is None:
+            msg = "STT service is not initialized."
+            raise RuntimeError(msg)
+
+        async with self._lock:
+            audio_duration_secs = calculate_audio_duration(pcm_size, self.audio_format)
             logger.debug(
                 "Sending %.2f seconds of audio to Gemini for transcription.",
                 audio_duration_secs,
@@ -135,34 +256,27 @@ class GoogleSTT(STT):
                         ),
                     ],
                 )
-
-                transcribed_text = (response.text or "").strip()
-
-                # Track usage
-                add_usage(
-                    service="gemini_stt",
-                    usage={"seconds": audio_duration_secs},
-                    meta={"model": self._model},
-                )
-
-                if transcribed_text:
-                    # Determine the primary speaker
-                    speaker = (
-                        max(speakers.items(), key=lambda item: item[1])[0]
-                        if speakers
-                        else None
-                    )
-
-                    yield TranscriptSegment(
-                        text=transcribed_text,
-                        start=start_time or 0.0,
-                        end=end_time,
-                        speaker=speaker,
-                    )
-                else:
-                    logger.info("Gemini returned an empty transcription.")
-
+            except asyncio.CancelledError:
+                # a discarded speculative request was still sent and is billed
+                self._track_usage(audio_duration_secs)
+                raise
             except Exception as e:
                 logger.exception("Error during Gemini transcription")
                 msg = f"Failed to transcribe audio with Gemini: {e}"
                 raise RuntimeError(msg) from e
+
+            self._track_usage(audio_duration_secs)
+
+            return (response.text or "").strip()
+
+    def _track_usage(self, audio_duration_secs: float) -> None:
+        """Track the usage of a transcription request.
+
+        Args:
+            audio_duration_secs: The duration of the sent audio in seconds.
+        """
+        add_usage(
+            service="gemini_stt",
+            usage={"seconds": audio_duration_secs},
+            meta={"model": self._model},
+        )
@@ -1,12 +1,16 @@
 import asyncio
 import logging
-from collections import defaultdict
+import threading
+import time
+import weakref
+from collections import OrderedDict, defaultdict
 from collections.abc import AsyncIterator
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from typing import Self
 
 import numpy as np
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.transcribe import Segment
 
 from joinly.core import STT
 from joinly.settings import get_settings
@@ -15,15 +19,142 @@ from joinly.types import (
     SpeechWindow,
     TranscriptSegment,
 )
-from joinly.utils.audio import calculate_audio_duration
 
 logger = logging.getLogger(__name__)
 
+_INITIAL_BUFFER_SECONDS = 10.0
+# temperatures to fall back to when a greedy decode fails the quality thresholds
+_TEMPERATURES = (0.0, 0.2, 0.4, 0.6)
+# minimum seconds between warnings about dropped audio
+_DROP_WARNING_INTERVAL = 10.0
+
+
+# loaded models keyed by (model name, device, compute type, number of workers)
+_ModelKey = tuple[str, str, str, int]
+_MODEL_CACHE_SIZE = 2
+# models in use stay shared, the most recently used ones also stay loaded idle
+_live_models: weakref.WeakValueDictionary[_ModelKey, WhisperModel] = (
+    weakref.WeakValueDictionary()
+)
+_recent_models: OrderedDict[_ModelKey, WhisperModel] = OrderedDict()
+_model_locks: defaultdict[_ModelKey, threading.Lock] = defaultdict(threading.Lock)
+_models_lock = threading.Lock()
+
+
+def _load_model(
+    model_name: str,
+    device: str,
+    compute_type: str,
+    num_workers: int,
+    *,
+    local_files_only: bool,
+) -> WhisperModel:
+    """Load a Whisper model, reusing it across STT instances and sessions.
+
+    Concurrent loads of the same model wait for a single load instead of loading
+    it again, and a model is never reloaded while another instance still uses it.
+
+    Args:
+        model_name: The Whisper model to load.
+        device: The device to load the model on.
+        compute_type: The compute type for the model.
+        num_workers: The number of model workers.
+        local_files_only: Whether to only use already downloaded model files.
+
+    Returns:
+        WhisperModel: The loaded model.
+    """
+    key = (model_name, device, compute_type, num_workers)
+    with _models_lock:
+        lock = _model_locks[key]
+    with lock:
+        model = _live_models.get(key)
+        if model is None:
+            model = WhisperModel(
+                model_name,
+                device=device,
+                compute_type=compute_type,
+                num_workers=num_workers,
+                local_files_only=local_files_only,
+            )
+            _live_models[key] = model
+        with _models_lock:
+            _recent_models[key] = model
+            _recent_models.move_to_end(key)
+            while len(_recent_models) > _MODEL_CACHE_SIZE:
+                _recent_models.popitem(last=False)
+    return model
+
+
+# prompt tokens keyed by (model name, device, compute type, hotwords), never by
+# the model itself so the cache does not keep evicted models alive
+_PromptKey = tuple[str, str, str, str]
+_PROMPT_CACHE_SIZE = 8
+_prompt_tokens: OrderedDict[_PromptKey, tuple[int, ...] | None] = OrderedDict()
+
+
+def _encode_prompt(
+    model: WhisperModel, text: str, *, key: _PromptKey
+) -> tuple[int, ...] | None:
+    """Tokenize the hotwords once so they are not re-encoded per utterance.
+
+    The tokens are encoded and truncated the same way faster-whisper handles
+    the hotwords string. The result is cached across sessions using the same
+    model configuration and hotwords.
+
+    Args:
+        model: The loaded Whisper model.
+        text: The space separated hotwords.
+        key: The model configuration and hotwords identifying the tokens.
+
+    Returns:
+        tuple[int, ...] | None: The prompt token ids, or None if the tokenizer is
+            not accessible.
+    """
+    if key in _prompt_tokens:
+        _prompt_tokens.move_to_end(key)
+        return _prompt_tokens[key]
+
+    tokens: tuple[int, ...] | None
+    try:
+        ids = model.hf_tokenizer.encode(
+            " " + text.strip(), add_special_tokens=False
+        ).ids
+        tokens = tuple(ids[: model.max_length // 2 - 1])
+    except AttributeError:
+        tokens = None
+
+    _prompt_tokens[key] = tokens
+    if len(_prompt_tokens) > _PROMPT_CACHE_SIZE:
+        _prompt_tokens.popitem(last=False)
+    return tokens
+
+
+def _dominant_speaker(
+    speakers: dict[str, int], ids: list[int], counts: list[int]
+) -> tuple[str | None, int]:
+    """Reduce the per-window speaker samples to the dominant speaker.
+
+    Args:
+        speakers: Mapping of speaker names to their index, in insertion order.
+        ids: The speaker index of each speech window.
+        counts: The number of samples of each speech window.
+
+    Returns:
+        tuple[str | None, int]: The speaker with the most samples and that number
+            of samples, or (None, 0) if no speaker was seen.
+    """
+    if not ids:
+        return None, 0
+    totals = np.bincount(ids, weights=counts, minlength=len(speakers))
+    idx = int(totals.argmax())
+    return list(speakers)[idx], int(totals[idx])
+
 
 class WhisperSTT(STT):
     """A class to transcribe audio using Whisper."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         model_name: str | None = None,
@@ -31,30 +162,56 @@ class WhisperSTT(STT):
         min_audio: float = 0.4,
         min_silence: float = 0.2,
         hotwords: list[str] | None = None,
+        num_workers: int = 1,
+        batch_size: int | None = None,
+        beam_size: int = 1,
+        max_pending: int = 10,
     ) -> None:
         """Initialize the WhisperSTT.
 
         Args:
             model_name: The Whisper model to use (default is None, where for cpu it
-                uses "base" and for cuda "distil-large-v3").
+                uses "base" and for cuda "large-v3-turbo").
             compute_type: The compute type for the model (default is "auto").
             min_audio: Minimum audio length (in seconds) to consider for transcription.
             min_silence: Minimum silence length (in seconds) to consider before ending
                 a segment.
             hotwords: A list of hotwords to improve transcription accuracy.
+            num_workers: Number of model workers, allowing this many utterances to
+                be transcribed concurrently (default is 1).
+            batch_size: Decode the chunks of an utterance in batches of this size
+                using the batched inference pipeline, None decodes sequentially
+                (default is None).
+            beam_size: The beam size for decoding, where 1 decodes greedily which
+                suits short utterances (default is 1).
+            max_pending: Maximum number of utterances waiting for transcription,
+                beyond which the oldest one is dropped (default is 10).
         """
         self.model_name = model_name or (
-            "distil-large-v3" if get_settings().device == "cuda" else "base"
+            "large-v3-turbo" if get_settings().device == "cuda" else "base"
         )
         self._set_model_name = model_name is not None
         self.compute_type = compute_type
         self.min_audio = min_audio
         self.min_silence = min_silence
-        hotwords_arr = (hotwords or []) + [get_settings().name]
-        self._hotwords_str = " ".join(hotwords_arr)
+        self._hotwords_str = " ".join([*(hotwords or []), get_settings().name])
         self.audio_format = AudioFormat(sample_rate=16000, byte_depth=4)
+        sample_rate = self.audio_format.sample_rate
+        self._inv_sample_rate = 1.0 / sample_rate
+        self._buffer_capacity = int(sample_rate * _INITIAL_BUFFER_SECONDS)
+        self._min_samples = int(sample_rate * min_audio)
+        self._min_silence_samples = int(sample_rate * min_silence)
         self._model: WhisperModel | None = None
-        self._sem = asyncio.BoundedSemaphore(1)
+        self._pipeline: BatchedInferencePipeline | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._hotword_tokens: tuple[int, ...] | None = None
+        self.batch_size = batch_size
+        self.beam_size = beam_size
+        self.max_pending = max_pending
+        self.num_workers = num_workers
+        self._sem = asyncio.BoundedSemaphore(num_workers)
+        self._dropped_chunks: int = 0
+        self._last_drop_warning: float | None = None
 
     async def __aenter__(self) -> Self:
         """Initialize the Whisper model."""
@@ -66,22 +223,54 @@ class WhisperSTT(STT):
         )
 
         self._model = await asyncio.to_thread(
-            WhisperModel,
+            _load_model,
             self.model_name,
-            device=get_settings().device,
-            compute_type=self.compute_type,
+            get_settings().device,
+            self.compute_type,
+            self.num_workers,
             local_files_only=not self._set_model_name,
         )
 
+        # decodes run on dedicated threads instead of the shared default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.num_workers, thread_name_prefix="whisper"
+        )
+        if self.batch_size is not None:
+            self._pipeline = BatchedInferencePipeline(model=self._model)
+        self._hotword_tokens = _encode_prompt(
+            self._model,
+            self._hotwords_str,
+            key=(
+                self.model_name,
+                get_settings().device,
+                self.compute_type,
+                self._hotwords_str,
+            ),
+        )
+
+        # the first decode allocates buffers and kernels, so do it before any speech
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                self._decode,
+                self._model,
+                np.zeros(self.audio_format.sample_rate, dtype=np.float32),
+            )
+        except Exception:
+            logger.warning("Whisper warmup failed", exc_info=True)
+
         logger.debug("Initialized Whisper model")
 
         return self
 
     async def __aexit__(self, *_exc: object) -> None:
         """Clean up resources when stopping the processor."""
-        if self._model is not None:
-            del self._model
-            self._model = None
+        # only the reference is dropped, the model stays cached for later sessions
+        self._model = None
+        self._pipeline = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
     async def stream(
         self, windows: AsyncIterator[SpeechWindow]
@@ -98,7 +287,9 @@ class WhisperSTT(STT):
             msg = "Model not initialized"
             raise RuntimeError(msg)
 
-        queue = asyncio.Queue[tuple[bytes, float, float, str | None] | None](maxsize=10)
+        queue = asyncio.Queue[tuple[np.ndarray, float, float, str | None] | None](
+            maxsize=self.max_pending
+        )
         buffer_task = asyncio.create_task(self._buffer_windows(windows, queue))
 
         try:
@@ -107,7 +298,7 @@ class WhisperSTT(STT):
                 if item is None:
                     break
                 data, start, end, speaker = item
-                async for segment in self._transcribe(data, start, end, speaker):
+                for segment in await self._transcribe(data, start, end, speaker):
                     yield segment
         finally:
             buffer_task.cancel()
@@ -115,77 +306,127 @@ class WhisperSTT(STT):
     async def _buffer_windows(
         self,
         windows: AsyncIterator[SpeechWindow],
-        queue: asyncio.Queue[tuple[bytes, float, float, str | None] | None],
+        queue: asyncio.Queue[tuple[np.ndarray, float, float, str | None] | None],
     ) -> None:
         """Buffer audio windows into the queue.
 
+        The samples are written into a preallocated float32 array and a view of
+        the filled part is queued, so no intermediate byte copies are made.
+
         Args:
             windows: An AsyncIterator of SpeechWindow objects.
             queue: The queue to put buffered audio chunks into.
         """
-        buffer = bytearray()
+        sample_rate = self.audio_format.sample_rate
+        inv_sample_rate = self._inv_sample_rate
+        capacity = self._buffer_capacity
+        min_samples = self._min_samples
+        min_silence_samples = self._min_silence_samples
+        buffer = np.empty(capacity, dtype=np.float32)
+        n_samples: int = 0
         start: float | None = None
-        speakers: defaultdict[str, float] = defaultdict(int)
-        silence_bytes: int = 0
-        byte_per_second: int = (
-            self.audio_format.sample_rate * self.audio_format.byte_depth
-        )
-        min_bytes: int = int(byte_per_second * self.min_audio)
-        min_silence_bytes: int = int(byte_per_second * self.min_silence)
+        # speaker samples are collected per window and reduced once per flush
+        speakers: dict[str, int] = {}
+        speaker_ids: list[int] = []
+        speaker_samples: list[int] = []
+        silence_samples: int = 0
 
         async for window in windows:
             if window.is_speech and start is None:
                 start = window.time_ns / 1e9
 
             if start is not None:
-                buffer.extend(window.data)
+                samples = np.frombuffer(window.data, dtype=np.float32)
+                n_new = n_samples + len(samples)
+                if n_new > len(buffer):
+                    grown = np.empty(max(2 * len(buffer), n_new), dtype=np.float32)
+                    grown[:n_samples] = buffer[:n_samples]
+                    buffer = grown
+                buffer[n_samples:n_new] = samples
+                n_samples = n_new
                 if window.is_speech:
-                    silence_bytes = 0
+                    silence_samples = 0
                     if window.speaker is not None:
-                        speakers[window.speaker] += calculate_audio_duration(
-                            len(window.data), self.audio_format
+                        speaker_ids.append(
+                            speakers.setdefault(window.speaker, len(speakers))
                         )
+                        speaker_samples.append(len(samples))
                 else:
-                    silence_bytes += len(window.data)
-
-                if len(buffer) >= min_bytes and silence_bytes >= min_silence_bytes:
-                    end = start + int(len(buffer) / byte_per_second)
-                    speaker, speaker_time = max(
-                        speakers.items(),
-                        key=lambda x: x[1],
-                        default=(None, 0),
+                    silence_samples += len(samples)
+
+                if n_samples >= min_samples and silence_samples >= min_silence_samples:
+                    end = start + n_samples // sample_rate
+                    speaker, speaker_n = _dominant_speaker(
+                        speakers, speaker_ids, speaker_samples
                     )
-                    if speaker_time < 0.1 * (end - start):
+                    if speaker_n * inv_sample_rate < 0.1 * (end - start):
                         speaker = None
-                    await queue.put((bytes(buffer), start, end, speaker))
-                    buffer.clear()
+                    self._put_latest(queue, (buffer[:n_samples], start, end, speaker))
+                    # the queued view keeps the old array, so start a fresh one
+                    buffer = np.empty(capacity, dtype=np.float32)
+                    n_samples = 0
                     start = None
                     speakers.clear()
-                    silence_bytes = 0
+                    speaker_ids.clear()
+                    speaker_samples.clear()
+                    silence_samples = 0
 
-        if start is not None and buffer:
-            end = start + int(len(buffer) / byte_per_second)
-            speaker = max(speakers.items(), key=lambda item: item[1])[0]
-            await queue.put((bytes(buffer), start, end, speaker))
+        if start is not None and n_samples:
+            end = start + n_samples // sample_rate
+            speaker, _ = _dominant_speaker(speakers, speaker_ids, speaker_samples)
+            self._put_latest(queue, (buffer[:n_samples], start, end, speaker))
+        # the end of the stream waits for room instead of dropping audio
         await queue.put(None)
 
+    def _put_latest(
+        self,
+        queue: asyncio.Queue[tuple[np.ndarray, float, float, str | None] | None],
+        item: tuple[np.ndarray, float, float, str | None],
+    ) -> None:
+        """Queue an item, dropping the oldest pending audio if the queue is full.
+
+        Dropping instead of blocking keeps the latency bounded when transcription
+        falls behind, rather than stalling the audio windows behind it.
+
+        Args:
+            queue: The queue of buffered audio chunks.
+            item: The audio chunk to queue.
+        """
+        if queue.full():
+            dropped = queue.get_nowait()
+            if dropped is not None:
+                self._dropped_chunks += 1
+                now = time.monotonic()
+                if (
+                    self._last_drop_warning is None
+                    or now - self._last_drop_warning >= _DROP_WARNING_INTERVAL
+                ):
+                    self._last_drop_warning = now
+                    logger.warning(
+                        "Transcription is falling behind, dropped %.2fs of audio "
+                        "(%d chunks dropped in total).",
+                        len(dropped[0]) * self._inv_sample_rate,
+                        self._dropped_chunks,
+                    )
+        queue.put_nowait(item)
+
     async def _transcribe(
         self,
-        data: bytes,
+        data: np.ndarray,
         start: float,
         end: float | None = None,
         speaker: str | None = None,
-    ) -> AsyncIterator[TranscriptSegment]:
-        """Process the input audio chunk and yield transcriptions.
+    ) -> list[TranscriptSegment]:
+        """Process the input audio chunk and return its transcriptions.
 
         Args:
-            data: Audio data in bytes format.
+            data: Audio samples as a float32 array.
             start: The start time of the audio segment.
             end: The end time of the audio segment.
             speaker: The speaker identifier.
 
-        Yields:
-            TranscriptSegment: The transcribed segment.
+        Returns:
+            list[TranscriptSegment]: The transcribed segments of the chunk.
         """
         if self._model is None:
             msg = "Model not initialized"
@@ -194,31 +435,70 @@ class WhisperSTT(STT):
         async with self._sem:
             logger.debug(
                 "Processing audio chunk of size: %d (%.2fs)",
-                len(data),
-                calculate_audio_duration(len(data), self.audio_format),
+                data.nbytes,
+                len(data) * self._inv_sample_rate,
+            )
+
+            segments = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._decode, self._model, data
+            )
+
+        limit = end or float("inf")
+        return [
+            TranscriptSegment(
+                text=text,
+                start=min(start + seg.start, limit),
+                end=min(start + seg.end, limit),
+                speaker=speaker,
             )
+            for seg in segments
+            if (text := seg.text.strip())
+        ]
+
+    def _decode(self, model: WhisperModel, data: np.ndarray) -> list[Segment]:
+        """Transcribe the audio and drain the lazy segment generator in one go.
 
-            audio_segment = np.frombuffer(data, dtype=np.float32)
-            segments, _ = await asyncio.to_thread(
-                self._model.transcribe,
-                audio_segment,
+        Audio fitting into a single Whisper window is conditioned on the
+        pre-tokenized hotwords, longer audio on the hotwords string, since
+        faster-whisper only applies an initial prompt to the first window.
+
+        Args:
+            model: The loaded Whisper model.
+            data: Audio samples as a float32 array.
+
+        Returns:
+            list[Segment]: The decoded Whisper segments.
+        """
+        if self._pipeline is not None:
+            # the batched pipeline re-encodes the prompt, so it gets the string
+            segments, _ = self._pipeline.transcribe(
+                data,
                 language=get_settings().language,
-                beam_size=5,
+                beam_size=self.beam_size,
+                temperature=_TEMPERATURES,
                 condition_on_previous_text=False,
                 hotwords=self._hotwords_str,
+                batch_size=self.batch_size,
             )
-
-            get_next_segment = partial(next, iter(segments), None)
-            while True:
-                seg = await asyncio.to_thread(get_next_segment)
-                if seg is None:
-                    break
-
-                text = seg.text.strip()
-                if text:
-                    yield TranscriptSegment(
-                        text=text,
-                        start=min(start + seg.start, end or float("inf")),
-                        end=min(start + seg.end, end or float("inf")),
-                        speaker=speaker,
-                    )
+        elif (
+            self._hotword_tokens is not None
+            and len(data) <= model.feature_extractor.n_samples
+        ):
+            segments, _ = model.transcribe(
+                data,
+                language=get_settings().language,
+                beam_size=self.beam_size,
+                temperature=_TEMPERATURES,
+                condition_on_previous_text=False,
+                initial_prompt=self._hotword_tokens,
+            )
+        else:
+            segments, _ = model.transcribe(
+                data,
+                language=get_settings().language,
+                beam_size=self.beam_size,
+                temperature=_TEMPERATURES,
+                condition_on_previous_text=False,
+                hotwords=self._hotwords_str,
+            )
+        return list(segments)
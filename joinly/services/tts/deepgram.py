@@ -1,6 +1,8 @@
 import asyncio
 import logging
-from collections.abc import AsyncIterator
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Callable
+from functools import cache
 from typing import Self
 
 from deepgram import (
@@ -14,10 +16,193 @@ from deepgram import (
 from joinly.core import TTS
 from joinly.settings import get_settings
 from joinly.types import AudioFormat
+from joinly.utils.cache import synthesis_cache
 from joinly.utils.usage import add_usage
 
 logger = logging.getLogger(__name__)
 
+_MAX_YIELD_BYTES = 16384
+_MAX_IDLE_CONNECTIONS = 2
+_IDLE_TIMEOUT = 60.0
+
+
+@cache
+def _deepgram_client() -> DeepgramClient:
+    """Get the Deepgram client shared by all TTS instances."""
+    config = DeepgramClientOptions(
+        options={
+            "keep_alive": True,
+            "speaker_playback": False,
+        }
+    )
+    return DeepgramClient(config=config)
+
+
+class _Connection:
+    """A pooled Deepgram TTS WebSocket routing its audio to the current user."""
+
+    def __init__(self, client: AsyncSpeakWebSocketClient) -> None:
+        """Wrap the client and register the event handlers once.
+
+        Args:
+            client: The (not yet started) Deepgram speak WebSocket client.
+        """
+        self.client = client
+        self.loop = asyncio.get_running_loop()
+        self.sink: Callable[[bytes | None], None] | None = None
+        self.evict_handle: asyncio.TimerHandle | None = None
+        # False while a synthesis may still deliver events, e.g. after an interrupt
+        self.settled = True
+        client.on(SpeakWebSocketEvents.AudioData, self._on_data)  # type: ignore[arg-type]
+        client.on(SpeakWebSocketEvents.Flushed, self._on_flushed)  # type: ignore[arg-type]
+
+    async def _on_data(
+        self, _client: AsyncSpeakWebSocketClient, data: bytes, **_kwargs: object
+    ) -> None:
+        """Handle binary data received from the WebSocket."""
+        logger.debug("Received binary data of size: %s", len(data))
+        if self.sink is not None:
+            self.sink(data)
+
+    async def _on_flushed(
+        self, _client: AsyncSpeakWebSocketClient, **_kwargs: object
+    ) -> None:
+        """Handle flushed event from the WebSocket."""
+        logger.debug("Flushed event received.")
+        if self.sink is not None:
+            self.sink(None)
+
+
+# idle connections keyed by (model name, sample rate, mip opt out)
+_PoolKey = tuple[str, int, bool]
+_idle_connections: defaultdict[_PoolKey, list[_Connection]] = defaultdict(list)
+_closing: set[asyncio.Task[None]] = set()
+# one task per event loop closing the idle connections on its shutdown
+_reapers: set[asyncio.Task[None]] = set()
+
+
+async def _finish(conn: _Connection) -> None:
+    """Close a connection and cancel its pending eviction.
+
+    Args:
+        conn: The connection to close.
+    """
+    if conn.evict_handle is not None:
+        conn.evict_handle.cancel()
+        conn.evict_handle = None
+    conn.sink = None
+    logger.debug("Closing Deepgram TTS service connection")
+    try:
+        if conn.loop is asyncio.get_running_loop() or conn.loop.is_closed():
+            await conn.client.finish()
+        else:
+            # the socket belongs to the other loop, so it has to be closed there
+            asyncio.run_coroutine_threadsafe(conn.client.finish(), conn.loop)
+    except Exception:
+        logger.warning("Failed to close Deepgram TTS connection", exc_info=True)
+
+
+async def _close_idle_connections(*, stale_only: bool = False) -> None:
+    """Close the pooled idle connections.
+
+    Args:
+        stale_only: Whether to only close connections that cannot be reused
+            anymore, since they were disconnected or belong to another event loop.
+    """
+    loop = asyncio.get_running_loop()
+    for idle in _idle_connections.values():
+        for conn in list(idle):
+            if stale_only and conn.loop is loop and await conn.client.is_connected():
+                continue
+            if conn in idle:
+                idle.remove(conn)
+                await _finish(conn)
+
+
+async def _reap_idle_connections() -> None:
+    """Wait for the event loop to shut down and close the idle connections then."""
+    try:
+        await asyncio.Event().wait()
+    except asyncio.CancelledError:
+        await _close_idle_connections()
+        raise
+
+
+async def _acquire_connection(key: _PoolKey, options: SpeakWSOptions) -> _Connection:
+    """Reuse an idle connection for the key or open a new one.
+
+    Args:
+        key: The pool key matching the options.
+        options: The speak options a new connection is started with.
+
+    Returns:
+        _Connection: A connected Deepgram TTS connection.
+
+    Raises:
+        RuntimeError: If the connection to Deepgram could not be established.
+    """
+    loop = asyncio.get_running_loop()
+    idle = _idle_connections[key]
+    while idle:
+        conn = idle.pop()
+        if conn.loop is loop and await conn.client.is_connected():
+            if conn.evict_handle is not None:
+                conn.evict_handle.cancel()
+                conn.evict_handle = None
+            logger.debug("Reusing idle Deepgram TTS connection")
+            return conn
+        await _finish(conn)
+
+    conn = _Connection(_deepgram_client().speak.asyncwebsocket.v("1"))
+    logger.info("Connecting to Deepgram TTS service with model: %s", options.model)
+    await conn.client.start(options, addons={"mip_opt_out": key[2]})
+    if not await conn.client.is_connected():
+        msg = "Failed to connect to Deepgram TTS service."
+        logger.error(msg)
+        raise RuntimeError(msg)
+    logger.debug("Connected to Deepgram TTS service")
+    return conn
+
+
+async def _release_connection(key: _PoolKey, conn: _Connection) -> None:
+    """Return a connection to the idle pool, or close it if it cannot be reused.
+
+    Connections whose last synthesis did not complete are closed, since late
+    audio or flush events from it would reach the next user of the connection.
+    Pooled connections are closed after staying idle for too long, or when the
+    event loop shuts down.
+
+    Args:
+        key: The pool key the connection was acquired with.
+        conn: The connection to release.
+    """
+    conn.sink = None
+    idle = _idle_connections[key]
+    if (
+        not conn.settled
+        or len(idle) >= _MAX_IDLE_CONNECTIONS
+        or not await conn.client.is_connected()
+    ):
+        await _finish(conn)
+        return
+
+    def _evict() -> None:
+        """Close the connection after it stayed idle for too long."""
+        conn.evict_handle = None
+        if conn in idle:
+            idle.remove(conn)
+            task = asyncio.create_task(_finish(conn))
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+
+    loop = asyncio.get_running_loop()
+    conn.evict_handle = loop.call_later(_IDLE_TIMEOUT, _evict)
+    idle.append(conn)
+    if not any(reaper.get_loop() is loop for reaper in _reapers):
+        reaper = loop.create_task(_reap_idle_connections())
+        _reapers.add(reaper)
+        reaper.add_done_callback(_reapers.discard)
+
 
 class DeepgramTTS(TTS):
     """Text-to-Speech (TTS) service for converting text to speech."""
@@ -38,14 +223,6 @@ class DeepgramTTS(TTS):
             mip_opt_out: Whether to opt out of the model improvement program
                 (default is True). See more at https://developers.deepgram.com/docs/the-deepgram-model-improvement-partnership-program.
         """
-        config = DeepgramClientOptions(
-            options={
-                "keep_alive": True,
-                "speaker_playback": False,
-            }
-        )
-        dg = DeepgramClient(config=config)
-        self._client: AsyncSpeakWebSocketClient = dg.speak.asyncwebsocket.v("1")
         if model_name is None and get_settings().language not in ["en", "es"]:
             logger.warning(
                 "Unsupported language %s for Deepgram TTS, falling back to English.",
@@ -62,84 +239,113 @@ class DeepgramTTS(TTS):
             sample_rate=sample_rate,
         )
         self._mip_opt_out = bool(mip_opt_out)
-        self._queue: asyncio.Queue[bytes | None] | None = None
+        self._conn: _Connection | None = None
+        self._pool_key: _PoolKey = (self.model_name, sample_rate, self._mip_opt_out)
+        self._chunks: deque[bytes | None] | None = None
+        self._chunks_ready = asyncio.Event()
         self._lock = asyncio.Lock()
         self.audio_format = AudioFormat(sample_rate=sample_rate, byte_depth=2)
 
     async def __aenter__(self) -> Self:
         """Enter the asynchronous context manager."""
-        if await self._client.is_connected():
+        if self._conn is not None:
             msg = "Already started the audio stream."
             raise RuntimeError(msg)
 
-        self._queue = asyncio.Queue[bytes | None]()
-
-        async def on_data(
-            _client: AsyncSpeakWebSocketClient, data: bytes, **_kwargs: object
-        ) -> None:
-            """Handle binary data received from the WebSocket."""
-            logger.debug("Received binary data of size: %s", len(data))
-            await self._queue.put(data)  # type: ignore[attr-defined]
-
-        async def on_flushed(
-            _client: AsyncSpeakWebSocketClient, **_kwargs: object
-        ) -> None:
-            """Handle flushed event from the WebSocket."""
-            logger.debug("Flushed event received.")
-            await self._queue.put(None)  # type: ignore[attr-defined]
-
-        self._client.on(SpeakWebSocketEvents.AudioData, on_data)  # type: ignore[arg-type]
-        self._client.on(SpeakWebSocketEvents.Flushed, on_flushed)  # type: ignore[arg-type]
-
-        logger.info(
-            "Connecting to Deepgram TTS service with model: %s",
-            self._speak_options.model,
-        )
-        await self._client.start(
-            self._speak_options, addons={"mip_opt_out": self._mip_opt_out}
-        )
-        if not await self._client.is_connected():
-            msg = "Failed to connect to Deepgram TTS service."
-            logger.error(msg)
-            raise RuntimeError(msg)
-        logger.debug("Connected to Deepgram TTS service")
+        self._chunks = deque()
+        self._chunks_ready.clear()
+        # connections are pooled, so later sessions skip the handshake
+        self._conn = await _acquire_connection(self._pool_key, self._speak_options)
+        self._conn.sink = self._push_chunk
 
         return self
 
     async def __aexit__(self, *_exc: object) -> None:
         """Exit the asynchronous context manager."""
-        logger.debug("Closing Deepgram TTS service connection")
-        await self._client.finish()
-        self._queue = None
+        conn, self._conn = self._conn, None
+        self._chunks = None
+        if conn is not None:
+            await _release_connection(self._pool_key, conn)
+        await _close_idle_connections(stale_only=True)
+
+    def _push_chunk(self, chunk: bytes | None) -> None:
+        """Hand received audio over to the consuming stream.
 
-    async def stream(self, text: str) -> AsyncIterator[bytes]:
+        Args:
+            chunk: The received audio data, or None to mark the end of the speech.
+        """
+        if self._chunks is None:
+            return
+        self._chunks.append(chunk)
+        self._chunks_ready.set()
+
+    def stream(self, text: str) -> AsyncIterator[bytes | memoryview]:
         """Convert text to speech and stream the audio data.
 
+        Args:
+            text: The text to convert to speech.
+
+        Returns:
+            AsyncIterator[bytes | memoryview]: An asynchronous iterator that yields
+                audio chunks.
+        """
+        return synthesis_cache.stream(
+            text,
+            synthesis_cache.key(
+                "deepgram", self.model_name, self.audio_format.sample_rate, text
+            ),
+            lambda: self._stream(text),
+            chunk_size=_MAX_YIELD_BYTES,
+        )
+
+    async def _stream(self, text: str) -> AsyncIterator[bytes]:
+        """Send the text over the connection and stream the received audio.
+
         Args:
             text: The text to convert to speech.
 
         Yields:
             bytes: The audio data.
         """
-        if self._queue is None or not await self._client.is_connected():
+        chunks = self._chunks
+        conn = self._conn
+        if chunks is None or conn is None or not await conn.client.is_connected():
             msg = "TTS service is not started."
             raise RuntimeError(msg)
 
         async with self._lock:
-            # drain the queue to ensure no old data is left
-            while not self._queue.empty():
-                _ = self._queue.get_nowait()
+            # ensure no old data is left
+            chunks.clear()
+            self._chunks_ready.clear()
 
+            conn.settled = False
             try:
-                await self._client.send_text(text)
-                await self._client.flush()
+                await conn.client.send_text(text)
+                await conn.client.flush()
                 add_usage(
                     service="deepgram_tts",
                     usage={"characters": len(text)},
                     meta={"model": self.model_name, "mip_opt_out": self._mip_opt_out},
                 )
 
-                while (chunk := await self._queue.get()) is not None:
-                    yield chunk
+                finished = False
+                while not finished:
+                    while not chunks:
+                        self._chunks_ready.clear()
+                        await self._chunks_ready.wait()
+
+                    # coalesce the frames that arrived since the last wake-up
+                    parts: list[bytes] = []
+                    size = 0
+                    while chunks and size < _MAX_YIELD_BYTES:
+                        chunk = chunks.popleft()
+                        if chunk is None:
+                            finished = True
+                            break
+                        parts.append(chunk)
+                        size += len(chunk)
+                    if parts:
+                        yield parts[0] if len(parts) == 1 else b"".join(parts)
+                conn.settled = True
             finally:
-                await self._client.clear()
+                await conn.client.clear()
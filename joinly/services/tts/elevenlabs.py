@@ -1,17 +1,25 @@
 import asyncio
 import logging
+import re
+import time
 from collections import defaultdict
 from collections.abc import AsyncIterator
+from typing import Any
 
 from elevenlabs.client import AsyncElevenLabs
 
 from joinly.core import TTS
 from joinly.settings import get_settings
 from joinly.types import AudioFormat
+from joinly.utils.cache import synthesis_cache
 from joinly.utils.usage import add_usage
 
 logger = logging.getLogger(__name__)
 
+_CHUNK_RE = re.compile(r"(?<=[.!?])\s+")
+_MAX_CONCURRENT_REQUESTS = 3
+_MULTILINGUAL_MODELS = frozenset({"eleven_flash_v2_5", "eleven_turbo_v2_5"})
+
 DEFAULT_VOICES = defaultdict(
     lambda: "XrExE9yKIg1WjnnlVkGX",
     {
@@ -41,33 +49,126 @@ class ElevenlabsTTS(TTS):
         self._voice_id = voice_id or DEFAULT_VOICES[get_settings().language]
         self._model_id = model_id
         self._output_format = f"pcm_{sample_rate}"
+        self._language_code = (
+            get_settings().language if model_id in _MULTILINGUAL_MODELS else None
+        )
+        # request parameters are constant for the session
+        self._stream_kwargs: dict[str, Any] = {
+            "voice_id": self._voice_id,
+            "model_id": self._model_id,
+            "output_format": self._output_format,
+            "language_code": self._language_code,
+        }
         self._client = AsyncElevenLabs()
         self._lock = asyncio.Lock()
         self.audio_format = AudioFormat(sample_rate=sample_rate, byte_depth=2)
 
-    def stream(self, text: str) -> AsyncIterator[bytes]:
+    def stream(self, text: str) -> AsyncIterator[bytes | memoryview]:
         """Convert text to speech and stream the audio data.
 
         Args:
             text: The text to convert to speech.
 
         Returns:
-            AsyncIterator[bytes]: An asynchronous iterator that yields audio chunks.
+            AsyncIterator[bytes | memoryview]: An asynchronous iterator that yields
+                audio chunks.
         """
-        language_code = None
-        if self._model_id in ("eleven_flash_v2_5", "eleven_turbo_v2_5"):
-            language_code = get_settings().language
+        return synthesis_cache.stream(
+            text,
+            synthesis_cache.key(
+                "elevenlabs",
+                self._model_id,
+                self._voice_id,
+                self._output_format,
+                self._language_code,
+                text,
+            ),
+            lambda: self._stream(text),
+        )
+
+    async def _stream(self, text: str) -> AsyncIterator[bytes]:
+        """Synthesize the sentences concurrently and stream them in order.
 
+        Args:
+            text: The text to convert to speech.
+
+        Yields:
+            bytes: The audio data.
+        """
         add_usage(
             service="elevenlabs_tts",
             usage={"characters": len(text)},
             meta={"model": self._model_id, "voice": self._voice_id},
         )
 
-        return self._client.text_to_speech.stream(
-            text=text,
-            voice_id=self._voice_id,
-            model_id=self._model_id,
-            output_format=self._output_format,
-            language_code=language_code,
-        )
+        sentences = _CHUNK_RE.split(text)
+        queues: list[asyncio.Queue[bytes | None]] = [asyncio.Queue() for _ in sentences]
+        sem = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        tasks = [
+            asyncio.create_task(
+                self._fetch(
+                    sentence,
+                    queue,
+                    sem,
+                    previous_text=sentences[i - 1] if i > 0 else None,
+                    next_text=sentences[i + 1] if i + 1 < len(sentences) else None,
+                )
+            )
+            for i, (sentence, queue) in enumerate(zip(sentences, queues, strict=True))
+        ]
+        start = time.monotonic()
+        first = True
+        try:
+            for task, queue in zip(tasks, queues, strict=True):
+                while (chunk := await queue.get()) is not None:
+                    if first:
+                        first = False
+                        logger.debug(
+                            "ElevenLabs time to first audio: %.3fs",
+                            time.monotonic() - start,
+                        )
+                    yield chunk
+                # raise errors of the request
+                await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            # retrieve the errors of requests that failed after being abandoned
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch(
+        self,
+        text: str,
+        queue: asyncio.Queue[bytes | None],
+        sem: asyncio.Semaphore,
+        *,
+        previous_text: str | None = None,
+        next_text: str | None = None,
+    ) -> None:
+        """Stream the audio of a single sentence into a queue.
+
+        Args:
+            text: The sentence to convert to speech.
+            queue: The queue receiving the audio, terminated by None.
+            sem: The semaphore bounding the concurrent requests.
+            previous_text: The preceding sentence, for continuous prosody.
+            next_text: The following sentence, for continuous prosody.
+        """
+        context = {
+            key: value
+            for key, value in (
+                ("previous_text", previous_text),
+                ("next_text", next_text),
+            )
+            if value
+        }
+        try:
+            async with sem:
+                async for chunk in self._client.text_to_speech.stream(
+                    text=text, **self._stream_kwargs, **context
+                ):
+                    # hand over every chunk as soon as it arrives
+                    if chunk:
+                        queue.put_nowait(chunk)
+        finally:
+            queue.put_nowait(None)
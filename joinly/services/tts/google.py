@@ -10,6 +10,7 @@ from google.genai import types
 from joinly.core import TTS
 from joinly.settings import get_settings
 from joinly.types import AudioFormat
+from joinly.utils.cache import synthesis_cache
 from joinly.utils.usage import add_usage
 
 logger = logging.getLogger(__name__)
@@ -44,7 +45,7 @@ class GoogleTTS(TTS):
         model_name: str = "gemini-2.5-flash-preview-tts",
         voice_name: str | None = None,
         sample_rate: int = REQUIRED_SAMPLE_RATE,
-        chunk_size_bytes: int = 4096,
+        chunk_size_bytes: int = 960,
     ) -> None:
         """Initialize the Gemini TTS service.
 
@@ -55,7 +56,8 @@ class GoogleTTS(TTS):
                 See https://ai.google.dev/gemini-api/docs/speech-generation#voice_options
                 for all 30 available voices.
             sample_rate: The sample rate of the audio. Gemini TTS outputs at 24kHz.
-            chunk_size_bytes: The size of audio chunks to yield in bytes.
+            chunk_size_bytes: The size of audio chunks to yield in bytes (default is
+                960, 20 ms of 24 kHz 16-bit audio). Rounded down to whole samples.
         """
         if os.getenv("GEMINI_API_KEY") is None and os.getenv("GOOGLE_API_KEY") is None:
             msg = "GEMINI_API_KEY or GOOGLE_API_KEY must be set in the environment."
@@ -73,17 +75,33 @@ class GoogleTTS(TTS):
         self._voice_name = voice_name or DEFAULT_VOICES.get(
             get_settings().language, "Puck"
         )
-        self._chunk_size_bytes = chunk_size_bytes
         self._client: genai.Client | None = None
+        self._config: types.GenerateContentConfig | None = None
         self._lock = asyncio.Lock()
 
         # Gemini TTS outputs 24kHz, 16-bit PCM audio
         self.audio_format = AudioFormat(sample_rate=sample_rate, byte_depth=2)
+        # never split a sample across chunks
+        byte_depth = self.audio_format.byte_depth
+        self._chunk_size_bytes = max(
+            byte_depth, chunk_size_bytes - chunk_size_bytes % byte_depth
+        )
 
     async def __aenter__(self) -> Self:
         """Initialize the Gemini client."""
         api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         self._client = genai.Client(api_key=api_key)
+        # the speech configuration is constant for the session
+        self._config = types.GenerateContentConfig(
+            response_modalities=["AUDIO"],
+            speech_config=types.SpeechConfig(
+                voice_config=types.VoiceConfig(
+                    prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                        voice_name=self._voice_name,
+                    )
+                )
+            ),
+        )
 
         logger.info(
             "Initialized Gemini TTS with model: %s and voice: %s",
@@ -95,20 +113,38 @@ class GoogleTTS(TTS):
     async def __aexit__(self, *_exc: object) -> None:
         """Clean up resources."""
         self._client = None
+        self._config = None
 
-    async def stream(self, text: str) -> AsyncIterator[bytes]:
+    def stream(self, text: str) -> AsyncIterator[bytes | memoryview]:
         """Convert text to speech and stream the audio data.
 
         Note: The Gemini TTS API generates the full audio at once.
         This method chunks the audio to simulate streaming.
 
+        Args:
+            text: The text to convert to speech.
+
+        Returns:
+            AsyncIterator[bytes | memoryview]: The audio data chunks (PCM format,
+                24kHz, 16-bit).
+        """
+        return synthesis_cache.stream(
+            text,
+            synthesis_cache.key("gemini", self._model, self._voice_name, text),
+            lambda: self._stream(text),
+            chunk_size=self._chunk_size_bytes,
+        )
+
+    async def _stream(self, text: str) -> AsyncIterator[memoryview]:
+        """Generate the audio and yield it in chunks.
+
         Args:
             text: The text to convert to speech.
 
         Yields:
-            bytes: The audio data chunks (PCM format, 24kHz, 16-bit).
+            memoryview: Zero-copy views of the audio data chunks.
         """
-        if self._client is None:
+        if self._client is None or self._config is None:
             msg = "TTS service is not initialized."
             raise RuntimeError(msg)
 
@@ -116,23 +152,11 @@ class GoogleTTS(TTS):
             logger.debug("Generating audio for text: '%s'", text)
 
             try:
-                # Configure speech generation
-                config = types.GenerateContentConfig(
-                    response_modalities=["AUDIO"],
-                    speech_config=types.SpeechConfig(
-                        voice_config=types.VoiceConfig(
-                            prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                voice_name=self._voice_name,
-                            )
-                        )
-                    ),
-                )
-
                 # Generate audio
                 response = await self._client.aio.models.generate_content(
                     model=self._model,
                     contents=text,
-                    config=config,
+                    config=self._config,
                 )
 
                 # Extract audio data
@@ -179,9 +203,10 @@ class GoogleTTS(TTS):
 
                 logger.debug("Generated %d bytes of audio data.", len(audio_data))
 
-                # Chunk the audio data for streaming
-                for i in range(0, len(audio_data), self._chunk_size_bytes):
-                    yield audio_data[i : i + self._chunk_size_bytes]
+                # Chunk the audio data for streaming without copying it
+                view = memoryview(audio_data)
+                for i in range(0, len(view), self._chunk_size_bytes):
+                    yield view[i : i + self._chunk_size_bytes]
 
             except Exception as e:
                 logger.exception("Error during Gemini TTS generation")
@@ -4,6 +4,7 @@ import os
 import pathlib
 import re
 from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Self
 
 from kokoro_onnx import Kokoro
@@ -11,6 +12,7 @@ from kokoro_onnx import Kokoro
 from joinly.core import TTS
 from joinly.settings import get_settings
 from joinly.types import AudioFormat
+from joinly.utils.cache import synthesis_cache
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +22,13 @@ _CHUNK_RE = re.compile(r"(?<=[.!?])\s+")
 class KokoroTTS(TTS):
     """Text-to-Speech (TTS) service for converting text to speech."""
 
-    def __init__(self, *, voice: str = "af_bella") -> None:
+    def __init__(self, *, voice: str = "af_bella", max_concurrency: int = 1) -> None:
         """Initialize the TTS service.
 
         Args:
             voice: The voice to use for TTS (default is "af_bella" for English).
+            max_concurrency: The maximum number of sentences synthesized in
+                parallel (default is 1).
         """
         default_voices = {
             "en": "af_bella",
@@ -41,7 +45,9 @@ class KokoroTTS(TTS):
             get_settings().language, default_voices["en"]
         )
         self._model: Kokoro | None = None
-        self._sem = asyncio.BoundedSemaphore(1)
+        self._max_concurrency = max(1, max_concurrency)
+        self._sem = asyncio.BoundedSemaphore(self._max_concurrency)
+        self._executor: ThreadPoolExecutor | None = None
         self.audio_format = AudioFormat(sample_rate=24000, byte_depth=4)
 
     async def __aenter__(self) -> Self:
@@ -58,12 +64,28 @@ class KokoroTTS(TTS):
             )
             raise RuntimeError(msg)
 
+        # long-lived inference threads keep the ONNX session warm between calls
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_concurrency, thread_name_prefix="kokoro"
+        )
+
         logger.info("Loading TTS model from %s", cache_dir)
-        self._model = await asyncio.to_thread(
-            Kokoro,
-            model_path=str(cache_dir / "kokoro-v1.0.onnx"),
-            voices_path=str(cache_dir / "voices-v1.0.bin"),
+        self._model = await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            lambda: Kokoro(
+                model_path=str(cache_dir / "kokoro-v1.0.onnx"),
+                voices_path=str(cache_dir / "voices-v1.0.bin"),
+            ),
         )
+
+        # the first inference initializes the ONNX session, so do it before any text
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._create, self._model, "a"
+            )
+        except Exception:
+            logger.warning("Kokoro warmup failed", exc_info=True)
+
         logger.debug("Loaded TTS model")
 
         return self
@@ -73,10 +95,29 @@ class KokoroTTS(TTS):
         if self._model is not None:
             del self._model
             self._model = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
-    async def stream(self, text: str) -> AsyncIterator[bytes]:
+    def stream(self, text: str) -> AsyncIterator[bytes | memoryview]:
         """Convert text to speech and stream the audio data.
 
+        Args:
+            text: The text to convert to speech.
+
+        Returns:
+            AsyncIterator[bytes | memoryview]: An asynchronous iterator that yields
+                audio chunks.
+        """
+        return synthesis_cache.stream(
+            text,
+            synthesis_cache.key("kokoro", self._voice, text),
+            lambda: self._stream(text),
+        )
+
+    async def _stream(self, text: str) -> AsyncIterator[bytes]:
+        """Synthesize the text sentence by sentence.
+
         Args:
             text: The text to convert to speech.
 
@@ -84,19 +125,37 @@ class KokoroTTS(TTS):
             bytes: The audio data for each text segment.
         """
         # further chunk down to speed up response time
-        chunks = _CHUNK_RE.split(text)
-        for chunk in chunks:
-            audio_data = await self._tts(chunk)
-            yield audio_data
+        # all chunks are scheduled upfront, the semaphore bounds the inference
+        tasks = [asyncio.create_task(self._tts(c)) for c in _CHUNK_RE.split(text)]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            # retrieve the errors of segments that failed after being abandoned
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _tts(self, text: str) -> bytes:
         """Convert text to speech."""
-        if self._model is None:
+        model = self._model
+        if model is None or self._executor is None:
             msg = "Model not initialized"
             raise RuntimeError(msg)
 
         async with self._sem:
-            return await asyncio.to_thread(
-                lambda text: self._model.create(text, voice=self._voice)[0].tobytes(),  # type: ignore[attr-defined]
-                text,
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._create, model, text
             )
+
+    def _create(self, model: Kokoro, text: str) -> bytes:
+        """Run the synthesis on an inference thread.
+
+        Args:
+            model: The loaded Kokoro model.
+            text: The text to convert to speech.
+
+        Returns:
+            bytes: The float32 PCM audio data.
+        """
+        return model.create(text, voice=self._voice)[0].tobytes()
@@ -2,12 +2,14 @@ import asyncio
 import logging
 import os
 from collections.abc import AsyncIterator
+from typing import Self
 
 import aiohttp
 
 from joinly.core import TTS
 from joinly.types import AudioFormat
-from joinly.utils.audio import calculate_audio_duration
+from joinly.utils.audio import calculate_audio_duration, wav_data_offset
+from joinly.utils.cache import synthesis_cache
 from joinly.utils.usage import add_usage
 
 logger = logging.getLogger(__name__)
@@ -41,39 +43,81 @@ class ResembleTTS(TTS):
         self._sample_rate = sample_rate
         self._precision = precision
         self._use_hd = use_hd
+        self._headers = {
+            "Authorization": f"Token {self._api_key}",
+            "Content-Type": "application/json",
+        }
+        # only the text changes between requests
+        self._payload: dict[str, str | int | bool] = {
+            "voice_uuid": self._voice_uuid,
+            "sample_rate": sample_rate,
+            "precision": precision,
+            "use_hd": use_hd,
+        }
+        if self._project_uuid:
+            self._payload["project_uuid"] = self._project_uuid
+        self._timeout = aiohttp.ClientTimeout(connect=4)
+        self._session: aiohttp.ClientSession | None = None
         self._lock = asyncio.Lock()
 
         byte_depth = 2 if precision == "PCM_16" else 4
         self.audio_format = AudioFormat(sample_rate=sample_rate, byte_depth=byte_depth)
 
-    async def stream(self, text: str) -> AsyncIterator[bytes]:
+    async def __aenter__(self) -> Self:
+        """Open the HTTP session reused across requests."""
+        if self._session is not None:
+            msg = "Resemble TTS session already started."
+            raise RuntimeError(msg)
+
+        # keep connections alive so requests skip the TCP and TLS handshake
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            )
+        )
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        """Close the HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def stream(self, text: str) -> AsyncIterator[bytes | memoryview]:
         """Convert text to speech and stream the audio data using HTTP streaming."""
-        async with self._lock:
-            headers = {
-                "Authorization": f"Token {self._api_key}",
-                "Content-Type": "application/json",
-            }
-            payload = {
-                "voice_uuid": self._voice_uuid,
-                "data": text,
-                "sample_rate": self._sample_rate,
-                "precision": self._precision,
-                "use_hd": self._use_hd,
-            }
-            if self._project_uuid:
-                payload["project_uuid"] = self._project_uuid
+        return synthesis_cache.stream(
+            text,
+            synthesis_cache.key(
+                "resemble",
+                self._voice_uuid,
+                self._project_uuid,
+                self._sample_rate,
+                self._precision,
+                self._use_hd,
+                text,
+            ),
+            lambda: self._stream(text),
+        )
 
+    async def _stream(self, text: str) -> AsyncIterator[bytes]:
+        """Request the synthesis and stream the received audio."""
+        session = self._session
+        if session is None:
+            msg = "TTS service is not started."
+            raise RuntimeError(msg)
+
+        async with self._lock:
             received_bytes = 0
             try:
-                async with (
-                    aiohttp.ClientSession() as session,
-                    session.post(
-                        self._streaming_endpoint,
-                        headers=headers,
-                        json=payload,
-                        timeout=aiohttp.ClientTimeout(connect=4),
-                    ) as resp,
-                ):
+                async with session.post(
+                    self._streaming_endpoint,
+                    headers=self._headers,
+                    json={**self._payload, "data": text},
+                    timeout=self._timeout,
+                ) as resp:
                     if resp.status != 200:  # noqa: PLR2004
                         body = await resp.text()
                         logger.error(
@@ -90,10 +134,10 @@ class ResembleTTS(TTS):
                         # skip the WAV header
                         if not data_start:
                             buf.extend(chunk)
-                            i = buf.find(b"data")
-                            if i == -1 or len(buf) < i + 8:
+                            offset = wav_data_offset(buf)
+                            if offset is None:
                                 continue
-                            chunk = bytes(buf[i + 8 :])  # noqa: PLW2901
+                            chunk = bytes(buf[offset:])  # noqa: PLW2901
                             buf.clear()
                             data_start = True
                             if not chunk:
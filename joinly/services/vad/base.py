@@ -8,6 +8,8 @@ from joinly.utils.audio import calculate_audio_duration_ns
 
 logger = logging.getLogger(__name__)
 
+_MAX_BATCH_WINDOWS = 8
+
 
 class BasePaddedVAD(VAD, abc.ABC):
     """A base vad implementation using fixed-size chunks."""
@@ -39,45 +41,63 @@ class BasePaddedVAD(VAD, abc.ABC):
         )
         time_ns: int = 0
         buffer = bytearray()
+        read_pos: int = 0
         pending: SpeechWindow | None = None
 
         async for chunk in chunks:
-            buffer_ns = calculate_audio_duration_ns(len(buffer), self.audio_format)
+            buffer_ns = calculate_audio_duration_ns(
+                len(buffer) - read_pos, self.audio_format
+            )
             time_ns = chunk.time_ns - buffer_ns
+            # drop consumed windows in one shift instead of one per window
+            if read_pos:
+                del buffer[:read_pos]
+                read_pos = 0
             buffer.extend(chunk.data)
 
-            while len(buffer) >= window_size:
-                window_bytes = bytes(buffer[:window_size])
-                is_speech = await self.is_speech(window_bytes)
-
-                if not is_speech:
-                    if pending:
-                        yield pending
-                    pending = SpeechWindow(
-                        data=window_bytes,
-                        time_ns=time_ns,
-                        is_speech=False,
-                        speaker=chunk.speaker,
-                    )
-                else:
-                    if pending:
+            while len(buffer) - read_pos >= window_size:
+                # classify the buffered windows together to amortize the overhead
+                n_windows = min(
+                    _MAX_BATCH_WINDOWS, (len(buffer) - read_pos) // window_size
+                )
+                with memoryview(buffer) as view:
+                    windows = [
+                        bytes(view[start : start + window_size])
+                        for start in range(
+                            read_pos, read_pos + n_windows * window_size, window_size
+                        )
+                    ]
+                read_pos += n_windows * window_size
+                results = await self.is_speech_batch(windows)
+
+                for window_bytes, is_speech in zip(windows, results, strict=True):
+                    if not is_speech:
+                        if pending:
+                            yield pending
+                        pending = SpeechWindow(
+                            data=window_bytes,
+                            time_ns=time_ns,
+                            is_speech=False,
+                            speaker=chunk.speaker,
+                        )
+                    else:
+                        if pending:
+                            yield SpeechWindow(
+                                data=pending.data,
+                                time_ns=pending.time_ns,
+                                is_speech=True,
+                                speaker=pending.speaker,
+                            )
+                        pending = None
+
                         yield SpeechWindow(
-                            data=pending.data,
-                            time_ns=pending.time_ns,
+                            data=window_bytes,
+                            time_ns=time_ns,
                             is_speech=True,
-                            speaker=pending.speaker,
+                            speaker=chunk.speaker,
                         )
-                    pending = None
-
-                    yield SpeechWindow(
-                        data=window_bytes,
-                        time_ns=time_ns,
-                        is_speech=True,
-                        speaker=chunk.speaker,
-                    )
 
-                del buffer[:window_size]
-                time_ns += chunk_ns
+                    time_ns += chunk_ns
 
         if pending:
             yield pending
@@ -93,3 +113,16 @@ class BasePaddedVAD(VAD, abc.ABC):
             bool: True if the window contains speech, False otherwise.
         """
         ...
+
+    async def is_speech_batch(self, windows: list[bytes]) -> list[bool]:
+        """Check consecutive audio windows for speech.
+
+        Implementations can override this to classify the windows in one call.
+
+        Args:
+            windows: The consecutive audio windows to check, in stream order.
+
+        Returns:
+            list[bool]: Whether each window contains speech.
+        """
+        return [await self.is_speech(window) for window in windows]
@@ -92,35 +92,67 @@ class SileroVAD(BasePaddedVAD):
         Returns:
             bool: True if the window contains speech, False otherwise.
         """
+        return (await self.is_speech_batch([window]))[0]
+
+    async def is_speech_batch(self, windows: list[bytes]) -> list[bool]:
+        """Check consecutive audio windows for speech in a single thread hop.
+
+        The windows are still run one after another, since each one continues
+        the model state of the previous one.
+
+        Args:
+            windows: The consecutive audio windows to check.
+
+        Returns:
+            list[bool]: Whether each window contains speech.
+        """
         if self._session is None or self._state is None:
             msg = "VAD model is not initialized"
             raise RuntimeError(msg)
 
-        input_data = np.frombuffer(window, dtype=np.float32)
-        if input_data.shape[0] != self.window_size_samples:
-            msg = (
-                "Window size does not match expected size, expected "
-                f"{self.window_size_samples} samples, got {input_data.shape[0]}."
+        inputs: list[np.ndarray] = []
+        for window in windows:
+            input_data = np.frombuffer(window, dtype=np.float32)
+            if input_data.shape[0] != self.window_size_samples:
+                msg = (
+                    "Window size does not match expected size, expected "
+                    f"{self.window_size_samples} samples, got {input_data.shape[0]}."
+                )
+                raise ValueError(msg)
+            inputs.append(input_data.reshape(1, -1))
+
+        return await asyncio.to_thread(self._run, self._session, inputs)
+
+    def _run(
+        self, session: ort.InferenceSession, inputs: list[np.ndarray]
+    ) -> list[bool]:
+        """Run the model over the windows in order.
+
+        Args:
+            session: The loaded inference session.
+            inputs: The windows, each shaped (1, window size).
+
+        Returns:
+            list[bool]: Whether each window contains speech.
+        """
+        results: list[bool] = []
+        for input_data in inputs:
+            outputs = session.run(
+                None,
+                {
+                    "input": input_data,
+                    "state": self._state,
+                    "sr": self._sr_tensor,
+                },
             )
-            raise ValueError(msg)
-        input_data = input_data.reshape(1, -1)
-
-        outputs = await asyncio.to_thread(
-            self._session.run,
-            None,
-            {
-                "input": input_data,
-                "state": self._state,
-                "sr": self._sr_tensor,
-            },
-        )
-        speech_prob = float(outputs[0].flat[0])  # type: ignore[attr-defined]
-        new_state = np.array(outputs[1], dtype=np.float32)
+            speech_prob = float(outputs[0].flat[0])  # type: ignore[attr-defined]
+            new_state = np.array(outputs[1], dtype=np.float32)
 
-        if self._use_state:
-            self._state = new_state
+            if self._use_state:
+                self._state = new_state
 
-        return speech_prob > self._speech_threshold
+            results.append(speech_prob > self._speech_threshold)
+        return results
 
     def reset_state(self) -> None:
         """Reset the internal state of the VAD."""
@@ -1,3 +1,5 @@
+import struct
+
 import numpy as np
 
 from joinly.types import AudioFormat, IncompatibleAudioFormatError
@@ -5,6 +7,13 @@ from joinly.types import AudioFormat, IncompatibleAudioFormatError
 BYTE_DEPTH_16 = 2
 BYTE_DEPTH_32 = 4
 
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+WAV_HEADER_SIZE = _WAV_HEADER.size
+_WAV_SIZE = struct.Struct("<I")
+_WAV_CHUNK = struct.Struct("<4sI")
+_RIFF_HEADER_SIZE = 12
+_INT16_TO_FLOAT = np.float32(1.0 / 32767.0)
+
 
 def convert_audio_format(
     data: bytes, source_format: AudioFormat, target_format: AudioFormat
@@ -37,16 +46,17 @@ def convert_audio_format(
         source_format.byte_depth == BYTE_DEPTH_32
         and target_format.byte_depth == BYTE_DEPTH_16
     ):
-        floats = np.frombuffer(data, dtype=np.float32)
-        ints = np.clip(floats * 32767.0, -32768, 32767).astype(np.int16)
-        return ints.tobytes()
+        scaled = np.frombuffer(data, dtype=np.float32) * np.float32(32767.0)
+        np.clip(scaled, -32768, 32767, out=scaled)
+        return scaled.astype(np.int16).tobytes()
 
     if (
         source_format.byte_depth == BYTE_DEPTH_16
         and target_format.byte_depth == BYTE_DEPTH_32
     ):
         ints = np.frombuffer(data, dtype=np.int16)
-        floats = ints.astype(np.float32) / 32767.0
+        # single vectorized pass that casts and scales without a temporary
+        floats = np.multiply(ints, _INT16_TO_FLOAT, dtype=np.float32)
         return floats.tobytes()
 
     msg = (
@@ -83,3 +93,79 @@ def calculate_audio_duration(byte_size: int, audio_format: AudioFormat) -> float
         float: The duration of the audio data in seconds.
     """
     return byte_size / (audio_format.sample_rate * audio_format.byte_depth)
+
+
+def wav_header(byte_size: int, audio_format: AudioFormat) -> bytes:
+    """Build the RIFF header of a mono PCM WAV file.
+
+    Prepending the header to the raw audio yields a valid WAV file without
+    copying the audio through the wave module.
+
+    Args:
+        byte_size: The size of the audio data in bytes.
+        audio_format: An AudioFormat object containing sample rate and byte depth.
+
+    Returns:
+        bytes: The 44 byte WAV header.
+    """
+    block_align = audio_format.byte_depth
+    return _WAV_HEADER.pack(
+        b"RIFF",
+        36 + byte_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        1,
+        audio_format.sample_rate,
+        audio_format.sample_rate * block_align,
+        block_align,
+        audio_format.byte_depth * 8,
+        b"data",
+        byte_size,
+    )
+
+
+def set_wav_size(header: bytearray | memoryview | np.ndarray, byte_size: int) -> None:
+    """Patch the size fields of a WAV header in place.
+
+    Allows reusing a header built once by `wav_header` for audio of any length.
+
+    Args:
+        header: A writable buffer starting with a WAV header.
+        byte_size: The size of the audio data in bytes.
+    """
+    _WAV_SIZE.pack_into(header, 4, 36 + byte_size)
+    _WAV_SIZE.pack_into(header, 40, byte_size)
+
+
+def wav_data_offset(data: bytes | bytearray) -> int | None:
+    """Find where the audio samples start in the beginning of a WAV stream.
+
+    Walks the RIFF sub-chunks instead of searching the bytes, so every header
+    byte is looked at once no matter how the stream was fragmented.
+
+    Args:
+        data: The bytes received so far, starting at the RIFF header.
+
+    Returns:
+        int | None: The offset of the first sample, or None if the header is
+            not complete yet.
+
+    Raises:
+        IncompatibleAudioFormatError: If the data is not a WAV stream.
+    """
+    if len(data) < _RIFF_HEADER_SIZE:
+        return None
+    if data[0:4] != b"RIFF" or data[8:12] != b"WAVE":
+        msg = "Audio stream is not in the WAV format."
+        raise IncompatibleAudioFormatError(msg)
+
+    offset = _RIFF_HEADER_SIZE
+    while offset + _WAV_CHUNK.size <= len(data):
+        chunk_id, chunk_size = _WAV_CHUNK.unpack_from(data, offset)
+        if chunk_id == b"data":
+            return offset + _WAV_CHUNK.size
+        # chunks are padded to an even size
+        offset += _WAV_CHUNK.size + chunk_size + (chunk_size & 1)
+    return None
@@ -0,0 +1,165 @@
+import asyncio
+import hashlib
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+
+# only short phrases repeat often enough to be worth caching
+_MAX_TEXT_LENGTH = 64
+
+
+class SynthesisCache:
+    """A bounded LRU cache for synthesized speech audio."""
+
+    __slots__ = (
+        "_entries",
+        "_inflight",
+        "_max_bytes",
+        "_max_entries",
+        "_size",
+    )
+
+    def __init__(
+        self, max_entries: int = 128, max_bytes: int = 16 * 1024 * 1024
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: The maximum number of cached syntheses (default is 128).
+            max_bytes: The maximum total size of the cached audio in bytes
+                (default is 16 MiB).
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._size = 0
+        self._entries: OrderedDict[bytes, bytes] = OrderedDict()
+        self._inflight: dict[bytes, asyncio.Future[bytes | None]] = {}
+
+    @staticmethod
+    def key(*parts: object) -> bytes:
+        """Create a cache key from the synthesis parameters.
+
+        Args:
+            *parts: The parameters identifying the synthesis, e.g. the backend,
+                model, voice and text.
+
+        Returns:
+            bytes: The cache key.
+        """
+        return hashlib.blake2b(
+            "|".join(map(str, parts)).encode(), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes) -> bytes | None:
+        """Get the cached audio for a key.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            bytes | None: The cached audio data, or None if not cached.
+        """
+        audio_data = self._entries.get(key)
+        if audio_data is not None:
+            self._entries.move_to_end(key)
+        return audio_data
+
+    def put(self, key: bytes, audio_data: bytes) -> None:
+        """Store audio for a key, evicting the least recently used entries.
+
+        Args:
+            key: The cache key.
+            audio_data: The audio data to cache.
+        """
+        if self._max_entries <= 0 or len(audio_data) > self._max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old)
+        self._entries[key] = audio_data
+        self._size += len(audio_data)
+        while len(self._entries) > self._max_entries or self._size > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    async def stream(
+        self,
+        text: str,
+        key: bytes,
+        synthesize: Callable[[], AsyncIterator[bytes | memoryview]],
+        *,
+        chunk_size: int = 4096,
+    ) -> AsyncIterator[bytes | memoryview]:
+        """Stream cached audio, or synthesize and cache it on a miss.
+
+        Audio is only cached if the synthesis completed, so interrupted
+        or failed streams are never replayed. Concurrent requests for the same
+        key wait for the running synthesis instead of starting another one.
+
+        Args:
+            text: The text being synthesized.
+            key: The cache key for the synthesis.
+            synthesize: A function starting the actual synthesis stream.
+            chunk_size: The size of the chunks cached audio is yielded in,
+                must be a multiple of the sample byte depth.
+
+        Yields:
+            bytes | memoryview: The audio data.
+        """
+        if len(text) > _MAX_TEXT_LENGTH:
+            async for chunk in synthesize():
+                yield chunk
+            return
+
+        audio_data = self.get(key)
+        inflight = self._inflight.get(key)
+        if audio_data is None and inflight is not None:
+            # shielded so a cancelled waiter does not cancel the shared result
+            audio_data = await asyncio.shield(inflight)
+        if audio_data is not None:
+            view = memoryview(audio_data)
+            for i in range(0, len(view), chunk_size):
+                yield view[i : i + chunk_size]
+            return
+
+        async for chunk in self._fill(key, synthesize):
+            yield chunk
+
+    async def _fill(
+        self,
+        key: bytes,
+        synthesize: Callable[[], AsyncIterator[bytes | memoryview]],
+    ) -> AsyncIterator[bytes | memoryview]:
+        """Run the synthesis, passing its audio on while caching it.
+
+        Args:
+            key: The cache key for the synthesis.
+            synthesize: A function starting the actual synthesis stream.
+
+        Yields:
+            bytes | memoryview: The audio data.
+        """
+        audio_data: bytes | None = None
+        future: asyncio.Future[bytes | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        try:
+            buf: bytearray | None = bytearray()
+            async for chunk in synthesize():
+                if buf is not None:
+                    buf.extend(chunk)
+                    # stop collecting audio that could never be cached
+                    if len(buf) > self._max_bytes:
+                        buf = None
+                yield chunk
+            if buf:
+                audio_data = bytes(buf)
+                self.put(key, audio_data)
+        finally:
+            # waiters synthesize themselves if this stream did not complete
+            future.set_result(audio_data)
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+
+synthesis_cache = SynthesisCache()
@@ -0,0 +1,115 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from types import SimpleNamespace
+
+import pytest
+
+from joinly.services.stt import deepgram
+from joinly.services.stt.deepgram import DeepgramSTT
+from joinly.types import SpeechWindow
+
+# 20 ms of 16 kHz 16-bit audio
+_WINDOW_BYTES = 640
+_WINDOW_NS = 20_000_000
+
+
+class _FakeListenClient:
+    """Fake Deepgram WebSocket recording the sent audio."""
+
+    def __init__(self) -> None:
+        """Initialize the fake client."""
+        self.sent: list[tuple[bytes, float]] = []
+        self._handler: Callable[..., object] | None = None
+        self._connected = False
+
+    def on(self, _event: object, handler: Callable[..., object]) -> None:
+        """Register the transcript handler."""
+        self._handler = handler
+
+    async def start(self, *_args: object, **_kwargs: object) -> bool:
+        """Open the connection."""
+        self._connected = True
+        return True
+
+    async def is_connected(self) -> bool:
+        """Get whether the connection is open."""
+        return self._connected
+
+    async def send(self, data: bytes) -> None:
+        """Record the sent audio with the time it was sent."""
+        self.sent.append((data, asyncio.get_running_loop().time()))
+
+    async def finalize(self) -> None:
+        """Answer with an empty finalized result."""
+        if self._handler is not None:
+            result = SimpleNamespace(channel=SimpleNamespace(alternatives=[]))
+            result.from_finalize = True
+            await self._handler(self, result)
+
+    async def finish(self) -> None:
+        """Close the connection."""
+        self._connected = False
+
+
+@pytest.fixture
+def fake_client(monkeypatch: pytest.MonkeyPatch) -> _FakeListenClient:
+    """Fixture providing the fake client used by new DeepgramSTT instances."""
+    client = _FakeListenClient()
+    listen = SimpleNamespace(asyncwebsocket=SimpleNamespace(v=lambda _v: client))
+    monkeypatch.setattr(
+        deepgram, "_deepgram_client", lambda: SimpleNamespace(listen=listen)
+    )
+    return client
+
+
+async def _transcribe(stt: DeepgramSTT, windows: AsyncIterator[SpeechWindow]) -> None:
+    """Run the windows through the STT service."""
+    async with stt:
+        async for _ in stt.stream(windows):
+            pass
+
+
+def _window(i: int) -> SpeechWindow:
+    """Create the i-th 20 ms speech window filled with its index."""
+    return SpeechWindow(
+        data=bytes([i]) * _WINDOW_BYTES, time_ns=i * _WINDOW_NS, is_speech=True
+    )
+
+
+async def test_deepgram_batches_windows(fake_client: _FakeListenClient) -> None:
+    """Test that windows are coalesced into batches of the configured size."""
+    stt = DeepgramSTT(padding_silence=0.0, batch_duration=0.1)
+    windows = [_window(i) for i in range(10)]
+
+    async def _source() -> AsyncIterator[SpeechWindow]:
+        for window in windows:
+            yield window
+
+    await _transcribe(stt, _source())
+
+    sent = [data for data, _ in fake_client.sent]
+    assert b"".join(sent) == b"".join(window.data for window in windows)
+    assert [len(data) for data in sent] == [5 * _WINDOW_BYTES] * 2
+
+
+async def test_deepgram_flushes_on_stall(fake_client: _FakeListenClient) -> None:
+    """Test that a pending batch is sent when the window source stalls."""
+    stt = DeepgramSTT(padding_silence=0.0, batch_duration=0.05)
+    resumed_at: float | None = None
+
+    async def _source() -> AsyncIterator[SpeechWindow]:
+        nonlocal resumed_at
+        yield _window(0)
+        await asyncio.sleep(0.3)
+        resumed_at = asyncio.get_running_loop().time()
+        yield _window(1)
+
+    await _transcribe(stt, _source())
+
+    assert resumed_at is not None
+    first, sent_at = fake_client.sent[0]
+    assert first == _window(0).data
+    assert sent_at < resumed_at
+    assert b"".join(data for data, _ in fake_client.sent) == (
+        _window(0).data + _window(1).data
+    )
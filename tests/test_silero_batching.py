@@ -0,0 +1,78 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from joinly.services.vad import silero
+from joinly.services.vad.silero import SileroVAD
+from joinly.types import AudioChunk
+
+
+class _FakeSession:
+    """Fake stateful Silero model whose decision depends on earlier windows."""
+
+    def __init__(self, *_args: object, **_kwargs: object) -> None:
+        """Initialize the fake session."""
+
+    def run(self, _outputs: object, inputs: dict[str, np.ndarray]) -> list[np.ndarray]:
+        """Decay the state towards the window mean and return it as probability."""
+        state = inputs["state"] * 0.5 + inputs["input"].mean()
+        return [state[:1, 0, :1], state]
+
+
+@pytest.fixture
+def fake_model(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fixture loading the fake model instead of the Silero ONNX model."""
+    (tmp_path / "silero").mkdir()
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(silero.ort, "InferenceSession", _FakeSession)
+
+
+def _windows(n: int, window_size: int) -> list[bytes]:
+    """Create random float32 audio windows of varying loudness."""
+    rng = np.random.default_rng(0)
+    return [
+        (rng.random(window_size, dtype=np.float32) * level).tobytes()
+        for level in rng.random(n, dtype=np.float32)
+    ]
+
+
+@pytest.mark.usefixtures("fake_model")
+async def test_silero_batch_matches_single_windows() -> None:
+    """Test that batched classification equals classifying window by window."""
+    async with SileroVAD() as single, SileroVAD() as batched:
+        windows = _windows(32, single.window_size_samples)
+
+        expected = [await single.is_speech(window) for window in windows]
+        results = await batched.is_speech_batch(windows[:5])
+        results += await batched.is_speech_batch(windows[5:])
+
+    assert results == expected
+    assert any(expected)
+    assert not all(expected)
+
+
+@pytest.mark.usefixtures("fake_model")
+async def test_silero_stream_matches_single_windows() -> None:
+    """Test that streamed windows are classified like single windows."""
+    async with SileroVAD() as single, SileroVAD() as streamed:
+        window_bytes = single.window_size_samples * single.audio_format.byte_depth
+        windows = _windows(32, single.window_size_samples)
+        expected = [await single.is_speech(window) for window in windows]
+
+        # uneven chunks, so batches of different sizes are classified
+        audio = b"".join(windows)
+        chunk_bytes = 3 * window_bytes + 100
+
+        async def _chunks() -> AsyncIterator[AudioChunk]:
+            for i, start in enumerate(range(0, len(audio), chunk_bytes)):
+                yield AudioChunk(data=audio[start : start + chunk_bytes], time_ns=i)
+
+        streamed_windows = [window async for window in streamed.stream(_chunks())]
+
+    assert b"".join(window.data for window in streamed_windows) == audio
+    # a silent window right before speech is marked as speech as well
+    for i, window in enumerate(streamed_windows):
+        next_speech = i + 1 < len(expected) and expected[i + 1]
+        assert window.is_speech == (expected[i] or next_speech)
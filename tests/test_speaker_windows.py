@@ -0,0 +1,105 @@
+import pytest
+
+from joinly.services.stt.deepgram import _SpeakerWindows
+
+
+async def test_speaker_windows_attribute_largest_overlap() -> None:
+    """Test that the speaker with the largest overlap is attributed."""
+    windows = _SpeakerWindows()
+    windows.append(0.0, 1.0, "alice")
+    windows.append(1.0, 3.0, "bob")
+    windows.append(3.0, 3.5, "alice")
+
+    speaker, overlap = await windows.dominant_speaker(0.5, 3.5)
+
+    assert speaker == "bob"
+    assert overlap == pytest.approx(2.0)
+
+
+async def test_speaker_windows_merge_adjacent_windows() -> None:
+    """Test that adjacent windows of the same speaker are merged."""
+    windows = _SpeakerWindows()
+    for i in range(10):
+        windows.append(i * 0.1, (i + 1) * 0.1, "alice")
+    windows.append(1.0, 1.1, "bob")
+    windows.append(1.5, 1.6, "bob")
+
+    assert len(windows) == 3  # noqa: PLR2004
+
+    speaker, overlap = await windows.dominant_speaker(0.25, 0.75)
+    assert speaker == "alice"
+    assert overlap == pytest.approx(0.5)
+
+
+async def test_speaker_windows_without_overlap() -> None:
+    """Test that intervals without overlapping windows have no speaker."""
+    windows = _SpeakerWindows()
+    windows.append(0.0, 1.0, "alice")
+    windows.append(1.0, 2.0, "bob")
+
+    assert await windows.dominant_speaker(5.0, 6.0) == (None, 0.0)
+
+
+async def test_speaker_windows_single_speaker_overlap() -> None:
+    """Test that a single observed speaker gets its actual overlap."""
+    windows = _SpeakerWindows()
+    windows.append(0.0, 1.0, "alice")
+    windows.append(2.0, 3.0, "alice")
+
+    speaker, overlap = await windows.dominant_speaker(0.9, 2.5)
+    assert speaker == "alice"
+    assert overlap == pytest.approx(0.6)
+
+    speaker, overlap = await windows.dominant_speaker(1.0, 2.0)
+    assert overlap == pytest.approx(0.0)
+
+
+async def test_speaker_windows_discard_passed_windows() -> None:
+    """Test that windows ending before a queried interval are discarded."""
+    windows = _SpeakerWindows()
+    windows.append(0.0, 1.0, "alice")
+    windows.append(1.0, 2.0, "bob")
+    windows.append(2.0, 3.0, "alice")
+
+    await windows.dominant_speaker(2.5, 3.0)
+
+    assert len(windows) == 1
+
+
+async def test_speaker_windows_grow() -> None:
+    """Test that windows beyond the initial capacity are kept."""
+    windows = _SpeakerWindows(capacity=2)
+    speakers = ["alice", "bob", "carol", "dave", "erin"]
+    for i, speaker in enumerate(speakers):
+        windows.append(float(i), i + 1.0, speaker)
+
+    assert len(windows) == len(speakers)
+    for i, speaker in enumerate(speakers):
+        assert await windows.dominant_speaker(i + 0.25, i + 0.75) == (speaker, 0.5)
+
+
+async def test_speaker_windows_compact() -> None:
+    """Test that attribution stays correct while the storage is compacted."""
+    capacity = 4
+    windows = _SpeakerWindows(capacity=capacity)
+    speakers = ["alice", "bob"]
+    for i in range(64):
+        windows.append(float(i), i + 1.0, speakers[i % 2])
+        if i >= 1:
+            speaker, overlap = await windows.dominant_speaker(i - 0.75, i + 0.5)
+            assert speaker == speakers[(i - 1) % 2]
+            assert overlap == pytest.approx(0.75)
+
+    assert len(windows) <= capacity
+
+
+async def test_speaker_windows_threaded_attribution() -> None:
+    """Test that attribution in a worker thread gives the same result."""
+    inline, threaded = _SpeakerWindows(), _SpeakerWindows(thread_threshold=1)
+    for windows in (inline, threaded):
+        for i in range(20):
+            windows.append(i * 0.5, (i + 1) * 0.5, ["alice", "bob", "carol"][i % 3])
+
+    assert await threaded.dominant_speaker(1.2, 6.3) == (
+        await inline.dominant_speaker(1.2, 6.3)
+    )
@@ -0,0 +1,174 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+
+import pytest
+
+from joinly.utils.cache import SynthesisCache
+
+
+class _Synthesizer:
+    """Fake synthesis counting its calls and yielding fixed audio chunks."""
+
+    def __init__(self, chunks: list[bytes], *, fail: bool = False) -> None:
+        """Initialize the synthesizer.
+
+        Args:
+            chunks: The audio chunks to yield.
+            fail: Whether to raise after yielding the chunks.
+        """
+        self.chunks = chunks
+        self.fail = fail
+        self.calls = 0
+
+    def __call__(self) -> AsyncIterator[bytes]:
+        """Start a synthesis stream."""
+        self.calls += 1
+        return self._stream()
+
+    async def _stream(self) -> AsyncIterator[bytes]:
+        """Yield the chunks with a pause in between."""
+        for chunk in self.chunks:
+            await asyncio.sleep(0.01)
+            yield chunk
+        if self.fail:
+            msg = "synthesis failed"
+            raise RuntimeError(msg)
+
+
+async def _collect(
+    cache: SynthesisCache,
+    key: bytes,
+    synthesize: Callable[[], AsyncIterator[bytes]],
+    text: str = "hello",
+) -> bytes:
+    """Stream a synthesis through the cache and join the audio."""
+    return b"".join(
+        [bytes(chunk) async for chunk in cache.stream(text, key, synthesize)]
+    )
+
+
+async def test_cache_replays_completed_synthesis() -> None:
+    """Test that a completed synthesis is replayed without synthesizing again."""
+    cache = SynthesisCache()
+    synthesize = _Synthesizer([b"ab", b"cd"])
+    key = cache.key("test", "hello")
+
+    assert await _collect(cache, key, synthesize) == b"abcd"
+    assert await _collect(cache, key, synthesize) == b"abcd"
+    assert synthesize.calls == 1
+
+
+async def test_cache_coalesces_concurrent_requests() -> None:
+    """Test that concurrent requests for the same key share one synthesis."""
+    cache = SynthesisCache()
+    synthesize = _Synthesizer([b"ab", b"cd"])
+    key = cache.key("test", "hello")
+
+    results = await asyncio.gather(
+        *(_collect(cache, key, synthesize) for _ in range(4))
+    )
+
+    assert results == [b"abcd"] * 4
+    assert synthesize.calls == 1
+
+
+async def test_cache_skips_interrupted_synthesis() -> None:
+    """Test that an interrupted synthesis is not cached."""
+    cache = SynthesisCache()
+    synthesize = _Synthesizer([b"ab", b"cd"])
+    key = cache.key("test", "hello")
+
+    stream = cache.stream("hello", key, synthesize)
+    assert bytes(await anext(stream)) == b"ab"
+    await stream.aclose()
+
+    assert cache.get(key) is None
+    calls = synthesize.calls
+    assert await _collect(cache, key, synthesize) == b"abcd"
+    assert synthesize.calls == calls + 1
+
+
+async def test_cache_skips_failed_synthesis() -> None:
+    """Test that a failed synthesis is not cached and waiters retry."""
+    cache = SynthesisCache()
+    failing = _Synthesizer([b"ab"], fail=True)
+    key = cache.key("test", "hello")
+
+    with pytest.raises(RuntimeError):
+        await _collect(cache, key, failing)
+
+    assert cache.get(key) is None
+    assert await _collect(cache, key, _Synthesizer([b"ab", b"cd"])) == b"abcd"
+
+
+async def test_cache_skips_long_text() -> None:
+    """Test that long texts bypass the cache."""
+    cache = SynthesisCache()
+    synthesize = _Synthesizer([b"ab"])
+    text = "x" * 100
+    key = cache.key("test", text)
+
+    await _collect(cache, key, synthesize, text)
+    await _collect(cache, key, synthesize, text)
+
+    assert synthesize.calls > 1
+    assert cache.get(key) is None
+
+
+def test_cache_evicts_least_recently_used_entries() -> None:
+    """Test that the entry limit evicts the least recently used entry."""
+    cache = SynthesisCache(max_entries=2)
+    cache.put(b"a", b"1")
+    cache.put(b"b", b"2")
+    assert cache.get(b"a") == b"1"
+    cache.put(b"c", b"3")
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == b"1"
+    assert cache.get(b"c") == b"3"
+
+
+def test_cache_evicts_over_byte_budget() -> None:
+    """Test that the byte budget evicts entries and rejects oversized audio."""
+    cache = SynthesisCache(max_bytes=10)
+    cache.put(b"a", b"x" * 4)
+    cache.put(b"b", b"x" * 4)
+    cache.put(b"c", b"x" * 4)
+
+    assert cache.get(b"a") is None
+    assert cache.get(b"b") is not None
+    assert cache.get(b"c") is not None
+
+    cache.put(b"d", b"x" * 11)
+    assert cache.get(b"d") is None
+    assert cache.get(b"c") is not None
+
+
+def test_cache_replaces_entry_size() -> None:
+    """Test that replacing an entry does not count its old size."""
+    cache = SynthesisCache(max_bytes=10)
+    cache.put(b"a", b"x" * 6)
+    cache.put(b"a", b"x" * 2)
+    cache.put(b"b", b"x" * 8)
+
+    assert cache.get(b"a") == b"x" * 2
+    assert cache.get(b"b") == b"x" * 8
+
+
+async def test_cache_waiter_synthesizes_after_failure() -> None:
+    """Test that a waiter synthesizes itself if the shared synthesis fails."""
+    cache = SynthesisCache()
+    key = cache.key("test", "hello")
+    failing = _Synthesizer([b"ab"], fail=True)
+    working = _Synthesizer([b"ab", b"cd"])
+
+    results = await asyncio.gather(
+        _collect(cache, key, failing),
+        _collect(cache, key, working),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] == b"abcd"
+    assert working.calls == 1
+    assert cache.get(key) == b"abcd"
@@ -0,0 +1,77 @@
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from joinly.types import AudioFormat, IncompatibleAudioFormatError
+from joinly.utils.audio import (
+    WAV_HEADER_SIZE,
+    set_wav_size,
+    wav_data_offset,
+    wav_header,
+)
+
+_AUDIO_FORMAT = AudioFormat(sample_rate=16000, byte_depth=2)
+
+
+def _wave_file(pcm: bytes, audio_format: AudioFormat) -> bytes:
+    """Encode the audio with the standard library wave module."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(audio_format.byte_depth)
+        wav_file.setframerate(audio_format.sample_rate)
+        wav_file.writeframes(pcm)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "audio_format",
+    [_AUDIO_FORMAT, AudioFormat(sample_rate=24000, byte_depth=4)],
+)
+def test_wav_header_matches_wave_module(audio_format: AudioFormat) -> None:
+    """Test that the built header matches the one written by the wave module."""
+    pcm = bytes(range(256)) * audio_format.byte_depth
+
+    assert wav_header(len(pcm), audio_format) + pcm == _wave_file(pcm, audio_format)
+
+
+def test_set_wav_size_patches_reused_header() -> None:
+    """Test that patching the sizes of a header equals building a new one."""
+    header = np.frombuffer(wav_header(0, _AUDIO_FORMAT), dtype=np.uint8).copy()
+
+    set_wav_size(header, 3200)
+
+    assert header.tobytes() == wav_header(3200, _AUDIO_FORMAT)
+
+
+def test_wav_data_offset_of_plain_header() -> None:
+    """Test that the data offset of a plain header is the header size."""
+    data = wav_header(4, _AUDIO_FORMAT) + b"\x00" * 4
+
+    assert wav_data_offset(data) == WAV_HEADER_SIZE
+
+
+def test_wav_data_offset_skips_extra_chunks() -> None:
+    """Test that chunks before the audio data are skipped, including padding."""
+    header = wav_header(4, _AUDIO_FORMAT)
+    fmt, data_chunk = header[:36], header[36:]
+    data = fmt + b"LIST" + (3).to_bytes(4, "little") + b"abc\x00" + data_chunk
+
+    assert wav_data_offset(data) == len(data)
+
+
+def test_wav_data_offset_waits_for_complete_header() -> None:
+    """Test that an incomplete header yields no offset for every prefix."""
+    data = wav_header(4, _AUDIO_FORMAT)
+
+    for end in range(len(data)):
+        assert wav_data_offset(data[:end]) is None
+    assert wav_data_offset(data) == len(data)
+
+
+def test_wav_data_offset_rejects_other_formats() -> None:
+    """Test that data which is not a WAV stream is rejected."""
+    with pytest.raises(IncompatibleAudioFormatError):
+        wav_data_offset(b"ID3\x04" + b"\x00" * 16)
@@ -0,0 +1,70 @@
+import logging
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from joinly.services.stt import whisper
+from joinly.services.stt.whisper import WhisperSTT
+from joinly.types import SpeechWindow
+
+_SAMPLE_RATE = 16000
+_WINDOW_SAMPLES = 512
+
+
+class _FakeModel:
+    """Fake Whisper model transcribing an utterance to the value of its samples."""
+
+    def transcribe(
+        self, data: np.ndarray, **_kwargs: object
+    ) -> tuple[list[SimpleNamespace], None]:
+        """Transcribe the audio to the value of its first sample."""
+        text = str(int(data[0])) if data.any() else ""
+        return [SimpleNamespace(text=text, start=0.0, end=0.5)], None
+
+
+@pytest.fixture
+def fake_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fixture loading the fake model instead of a Whisper model."""
+    monkeypatch.setattr(whisper, "_load_model", lambda *_args, **_kwargs: _FakeModel())
+
+
+async def _utterances(n: int) -> AsyncIterator[SpeechWindow]:
+    """Yield n utterances of 0.5s speech followed by 0.25s silence each.
+
+    The windows are yielded without pausing, so transcription falls behind.
+    """
+    time_ns = 0
+    window_ns = _WINDOW_SAMPLES * 1_000_000_000 // _SAMPLE_RATE
+    for i in range(1, n + 1):
+        for is_speech, seconds in ((True, 0.5), (False, 0.25)):
+            value = float(i) if is_speech else 0.0
+            for _ in range(int(seconds * _SAMPLE_RATE) // _WINDOW_SAMPLES):
+                data = np.full(_WINDOW_SAMPLES, value, dtype=np.float32).tobytes()
+                yield SpeechWindow(data=data, time_ns=time_ns, is_speech=is_speech)
+                time_ns += window_ns
+
+
+@pytest.mark.usefixtures("fake_model")
+async def test_whisper_drops_oldest_pending_utterances(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that the oldest utterances are dropped once too many are pending."""
+    caplog.set_level(logging.WARNING, logger=whisper.__name__)
+
+    async with WhisperSTT(max_pending=2) as stt:
+        texts = [segment.text async for segment in stt.stream(_utterances(5))]
+
+    assert texts == ["4", "5"]
+    warnings = [r for r in caplog.records if "dropped" in r.getMessage()]
+    assert len(warnings) == 1
+
+
+@pytest.mark.usefixtures("fake_model")
+async def test_whisper_keeps_utterances_within_limit() -> None:
+    """Test that no utterance is dropped while the queue has room."""
+    async with WhisperSTT(max_pending=10) as stt:
+        texts = [segment.text async for segment in stt.stream(_utterances(5))]
+
+    assert texts == ["1", "2", "3", "4", "5"]